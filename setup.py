@@ -33,7 +33,12 @@ setup(
         "pyyaml>=6.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
+            # Install the fast extra too so tests cover the orjson code path
+            "orjson>=3.9.0",
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "black>=22.0.0",
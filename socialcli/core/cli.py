@@ -12,6 +12,9 @@ Commands:
 """
 
 import click
+import logging
+import os
+import re
 import sys
 import webbrowser
 from http.server import HTTPServer, BaseHTTPRequestHandler
@@ -19,6 +22,7 @@ from urllib.parse import urlparse, parse_qs
 from datetime import datetime
 from pathlib import Path
 
+from socialcli import __version__
 from socialcli.core.storage import Storage
 from socialcli.core.config import Config, ProviderConfig
 from socialcli.core.scheduler_daemon import SchedulerDaemon
@@ -70,12 +74,10 @@ class CallbackHandler(BaseHTTPRequestHandler):
 
 
 @click.group()
-@click.version_option()
+@click.version_option(version=__version__, prog_name='socialcli')
 def cli():
     """SocialCLI - Manage social media posts from the command line."""
     # Configure logging
-    import logging
-    import os
     log_level = os.environ.get('SOCIALCLI_LOG_LEVEL', 'INFO').upper()
     logging.basicConfig(
         level=getattr(logging, log_level, logging.INFO),
@@ -430,7 +432,6 @@ def prune(before, after, status, dry_run):
 
     # Validate date formats if provided
     if before or after:
-        import re
         date_pattern = r'^\d{4}-\d{2}-\d{2}'
         if before and not re.match(date_pattern, before):
             click.echo(f"Error: Invalid date format for --before. Use YYYY-MM-DD", err=True)
@@ -23,6 +23,7 @@ class ProviderConfig:
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
     token_expiry: Optional[str] = None
+    person_urn: Optional[str] = None
 
     def validate(self, provider_name: str) -> List[str]:
         """Validate provider configuration.
@@ -91,7 +92,10 @@ class Config:
         providers = {}
         for name, provider_data in data.get('providers', {}).items():
             # Filter to only include fields that ProviderConfig accepts
-            valid_fields = {'client_id', 'client_secret', 'access_token', 'refresh_token', 'token_expiry'}
+            valid_fields = {
+                'client_id', 'client_secret', 'access_token', 'refresh_token',
+                'token_expiry', 'person_urn'
+            }
             filtered_data = {k: v for k, v in provider_data.items() if k in valid_fields}
             providers[name] = ProviderConfig(**filtered_data)
 
@@ -138,6 +142,7 @@ class Config:
             provider_data['access_token'] = provider_config.access_token
             provider_data['refresh_token'] = provider_config.refresh_token
             provider_data['token_expiry'] = provider_config.token_expiry
+            provider_data['person_urn'] = provider_config.person_urn
 
         with open(self.config_path, 'w') as f:
             yaml.dump(existing_data, f, default_flow_style=False)
@@ -218,3 +223,22 @@ class Config:
             provider_config.token_expiry = token_expiry
 
         self.save()
+
+    def update_person_urn(self, provider_name: str, person_urn: Optional[str]):
+        """Update the cached member URN for a provider.
+
+        The URN is resolved from the provider's profile endpoint once and
+        reused by later sessions to skip that round-trip.
+
+        Args:
+            provider_name: Name of the provider
+            person_urn: Member URN (e.g., 'urn:li:person:abc'), or None to clear
+        """
+        provider_config = self.providers.get(provider_name)
+        if provider_config is None:
+            provider_config = ProviderConfig()
+            self.providers[provider_name] = provider_config
+
+        provider_config.person_urn = person_urn
+
+        self.save()
@@ -4,20 +4,33 @@ Uses the Storage JSON backend to manage scheduled posts and executes them
 at the appropriate times using the configured providers.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import importlib
+import os
 import time
 import signal
 import logging
-from datetime import datetime
+import threading
 from typing import Optional
 from pathlib import Path
 
 from socialcli.core.storage import Storage
 from socialcli.core.config import Config
+from socialcli.providers.base import AuthenticationError
 from socialcli.utils.parser import PostParser
 
 
 logger = logging.getLogger(__name__)
 
+# Provider classes by name, as (module, class); imported on first use so
+# the daemon only loads the providers it actually posts to
+_PROVIDER_CLASSES = {
+    'linkedin': ('socialcli.providers.linkedin.provider', 'LinkedInProvider'),
+}
+
+# Longest single sleep between checks of the running flag (seconds)
+_WAIT_SLICE = 1.0
+
 
 class SchedulerDaemon:
     """Background daemon that executes scheduled posts at the correct times."""
@@ -25,16 +38,18 @@ class SchedulerDaemon:
     def __init__(
         self,
         storage: Optional[Storage] = None,
-        check_interval: int = 60
+        check_interval: int = 60,
+        max_workers: int = 4
     ):
         """Initialize the scheduler daemon.
 
         Args:
             storage: Storage instance to use. If None, creates a new one.
             check_interval: How often to check for pending posts (seconds)
+            max_workers: Maximum concurrent publishing threads, shared between
+                due posts and their media uploads
         """
         # Configure logging first with DEBUG level
-        import os
         log_level = os.environ.get('SOCIALCLI_LOG_LEVEL', 'INFO').upper()
         logging.basicConfig(
             level=getattr(logging, log_level, logging.INFO),
@@ -47,9 +62,25 @@ class SchedulerDaemon:
         
         self.storage = storage or Storage()
         self.check_interval = check_interval
+        self.max_workers = max_workers
         self.running = False
         self.config = Config.load(validate=False)
 
+        # Earliest publish_at_epoch among pending items not yet due
+        self._next_due_at: Optional[float] = None
+
+        # Storage updates are read-modify-write on one file; serialize the
+        # ones made from post worker threads
+        self._storage_lock = threading.Lock()
+
+        # Provider instances by name, reused so their HTTP sessions persist
+        self._provider_cache = {}
+        self._provider_lock = threading.Lock()
+
+        # Providers dropped after an auth failure, closed (and the config
+        # reloaded) once the workers that may share them have finished
+        self._evicted_providers = []
+
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -60,7 +91,10 @@ class SchedulerDaemon:
         self.running = False
 
     def _get_provider(self, provider_name: str):
-        """Initialize and return a provider instance.
+        """Return the provider instance for a name, creating it on first use.
+
+        A cached provider gets its access token revalidated on every use, so
+        a token close to expiry is refreshed just as for a new provider.
 
         Args:
             provider_name: Name of the provider (e.g., 'linkedin')
@@ -71,28 +105,110 @@ class SchedulerDaemon:
         Raises:
             ValueError: If provider is not supported or not configured
         """
-        if provider_name.lower() == 'linkedin':
-            from socialcli.providers.linkedin.provider import LinkedInProvider
-
-            # Get provider config
-            provider_config = self.config.get_provider_config('linkedin')
-            if not provider_config:
-                raise ValueError("LinkedIn provider not configured")
-
-            # Create provider with credentials from config
-            return LinkedInProvider(
-                client_id=provider_config.client_id,
-                client_secret=provider_config.client_secret,
-                config=self.config
-            )
-        else:
+        name = provider_name.lower()
+        with self._provider_lock:
+            provider = self._provider_cache.get(name)
+            if provider is None:
+                provider = self._build_provider(provider_name)
+                self._provider_cache[name] = provider
+            else:
+                self._refresh_access_token(provider)
+            return provider
+
+    @staticmethod
+    def _refresh_access_token(provider):
+        """Update a provider's API client with a currently valid access token.
+
+        Providers read the token once when built; get_valid_token() returns
+        it, refreshing and saving it first when it is about to expire.
+
+        Args:
+            provider: Cached provider instance
+        """
+        auth = getattr(provider, 'auth', None)
+        if auth is not None:
+            provider.client.access_token = auth.get_valid_token()
+
+    def _forget_provider(self, provider_name: str):
+        """Drop a cached provider so the next use builds a fresh one.
+
+        Safe to call from worker threads: other workers may still be sending
+        on the provider, so it is only queued here and closed later by
+        _close_evicted_providers().
+
+        Args:
+            provider_name: Name of the provider (e.g., 'linkedin')
+        """
+        with self._provider_lock:
+            provider = self._provider_cache.pop(provider_name.lower(), None)
+            if provider is not None:
+                self._evicted_providers.append(provider)
+
+    def _close_evicted_providers(self):
+        """Close providers dropped by _forget_provider() and reload the config.
+
+        The reload lets rebuilt providers see credentials saved since the
+        daemon started (e.g. by 'socialcli auth'). Call only when no worker
+        threads are running.
+        """
+        with self._provider_lock:
+            evicted = self._evicted_providers
+            self._evicted_providers = []
+        if not evicted:
+            return
+
+        self.config = Config.load(self.config.config_path, validate=False)
+        for provider in evicted:
+            provider.close()
+
+    def _close_providers(self):
+        """Close and drop all cached and evicted providers."""
+        with self._provider_lock:
+            providers = list(self._provider_cache.values())
+            self._provider_cache.clear()
+        for provider in providers:
+            provider.close()
+        self._close_evicted_providers()
+
+    def _build_provider(self, provider_name: str):
+        """Initialize a provider instance from the configuration.
+
+        Args:
+            provider_name: Name of the provider (e.g., 'linkedin')
+
+        Returns:
+            Provider instance
+
+        Raises:
+            ValueError: If provider is not supported or not configured
+        """
+        name = provider_name.lower()
+        try:
+            module_name, class_name = _PROVIDER_CLASSES[name]
+        except KeyError:
             raise ValueError(f"Unsupported provider: {provider_name}")
 
-    def _execute_post(self, post_data: dict) -> bool:
+        # Get provider config
+        provider_config = self.config.get_provider_config(name)
+        if not provider_config:
+            raise ValueError(f"{provider_name} provider not configured")
+
+        provider_class = getattr(importlib.import_module(module_name), class_name)
+
+        # Create provider with credentials from config
+        return provider_class(
+            client_id=provider_config.client_id,
+            client_secret=provider_config.client_secret,
+            config=self.config
+        )
+
+    def _execute_post(self, post_data: dict, upload_workers: Optional[int] = None) -> bool:
         """Execute a single scheduled post.
 
         Args:
             post_data: Post dictionary from storage
+            upload_workers: Maximum concurrent media uploads for this post
+                (default: the provider's own limit)
 
         Returns:
             True if post was successful, False otherwise
@@ -122,7 +238,7 @@ class SchedulerDaemon:
             media_ids = []
             media_titles = []
             if media_files:
-                logger.info(f"Uploading {len(media_files)} media file(s)")
+                media_paths = []
                 for media_file in media_files:
                     # Handle relative paths - assume relative to post file directory
                     media_path = Path(media_file)
@@ -135,12 +251,20 @@ class SchedulerDaemon:
                         logger.error(error_msg)
                         raise FileNotFoundError(error_msg)
 
-                    # Upload media - any exception will fail the entire post
-                    logger.info(f"Uploading media: {media_path}")
-                    media_urn = provider.upload_media(str(media_path))
-                    media_ids.append(media_urn)
-                    media_titles.append(media_path.name)  # Store filename for documents
-                    logger.info(f"Media uploaded successfully: {media_urn}")
+                    media_paths.append(media_path)
+
+                # Uploads are independent, so send them concurrently;
+                # any exception will fail the entire post
+                logger.info(f"Uploading {len(media_paths)} media file(s)")
+                upload_kwargs = {}
+                if upload_workers is not None:
+                    upload_kwargs['max_workers'] = upload_workers
+                media_ids = provider.upload_media_many(
+                    [str(path) for path in media_paths], **upload_kwargs
+                )
+                media_titles = [path.name for path in media_paths]  # Store filenames for documents
+                for media_path, media_urn in zip(media_paths, media_ids):
+                    logger.info(f"Media uploaded successfully: {media_path} -> {media_urn}")
 
                 # Verify all media uploaded successfully
                 if len(media_ids) != len(media_files):
@@ -161,7 +285,8 @@ class SchedulerDaemon:
 
             # Store URN for comment resolution (Task 19)
             if 'id' in result:
-                self.storage.update_scheduled_post(post_id, urn=result['id'])
+                with self._storage_lock:
+                    self.storage.update_scheduled_post(post_id, urn=result['id'])
                 logger.info(f"Post {post_id} URN stored: {result['id']}")
 
             logger.info(f"Post {post_id} published successfully: {result.get('url', 'N/A')}")
@@ -169,13 +294,30 @@ class SchedulerDaemon:
 
         except Exception as e:
             logger.error(f"Failed to execute post {post_id}: {e}", exc_info=True)
+            if isinstance(e, AuthenticationError):
+                # Credentials may have been refreshed since the provider was built
+                self._forget_provider(provider_name)
             return False
 
     def _process_posts(self):
         """Check for and process all pending posts (not comments) that are due."""
+        # Forget the last deadline first, so a failed read falls back to
+        # check_interval instead of reusing a deadline that may have passed
+        self._next_due_at = None
         try:
             # Get all pending items
             pending_items = self.storage.get_all_scheduled_posts(status='pending')
+            now_ts = time.time()
+
+            # Remember when the next item falls due so the loop can wake for it
+            self._next_due_at = min(
+                (
+                    item['publish_at_epoch'] for item in pending_items
+                    if item['publish_at_epoch'] is not None
+                    and item['publish_at_epoch'] > now_ts
+                ),
+                default=None
+            )
 
             # Filter for posts only (not comments)
             pending_posts = [item for item in pending_items if item.get('type') == 'post']
@@ -183,32 +325,43 @@ class SchedulerDaemon:
             if not pending_posts:
                 return
 
-            now = datetime.now()
-
             # Filter posts that are due
-            due_posts = []
-            for post in pending_posts:
-                publish_at = datetime.fromisoformat(post['publish_at'])
-                if publish_at <= now:
-                    due_posts.append(post)
+            due_posts = [
+                post for post in pending_posts
+                if post['publish_at_epoch'] is not None and post['publish_at_epoch'] <= now_ts
+            ]
 
             if not due_posts:
                 return
 
             logger.info(f"Found {len(due_posts)} post(s) due for publishing")
 
-            # Execute each due post
-            for post in due_posts:
-                post_id = post['id']
-                success = self._execute_post(post)
+            # Each post is a few blocking API calls, so publish them concurrently
+            # and record each status as soon as its post finishes
+            workers = min(self.max_workers, len(due_posts))
+            # Each post uploads its media on a pool of its own; split the
+            # thread budget so posts and uploads together stay within
+            # max_workers instead of multiplying
+            upload_workers = max(1, self.max_workers // workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._execute_post, post, upload_workers): post['id']
+                    for post in due_posts
+                }
+                for future in as_completed(futures):
+                    post_id = futures[future]
+                    success = future.result()
 
-                # Update status based on result
-                new_status = 'published' if success else 'failed'
-                self.storage.update_scheduled_post(post_id, status=new_status)
-                logger.info(f"Post {post_id} status updated to: {new_status}")
+                    # Update status based on result
+                    new_status = 'published' if success else 'failed'
+                    with self._storage_lock:
+                        self.storage.update_scheduled_post(post_id, status=new_status)
+                    logger.info(f"Post {post_id} status updated to: {new_status}")
 
         except Exception as e:
             logger.error(f"Error processing pending posts: {e}", exc_info=True)
+        finally:
+            self._close_evicted_providers()
 
     def _process_comments(self):
         """Check for and process all pending comments that are due.
@@ -225,6 +378,13 @@ class SchedulerDaemon:
 
             logger.info(f"Found {len(pending_comments)} comment(s) due for processing")
 
+            # Index posts by UUID once instead of re-reading storage for every
+            # parent lookup. Posts are processed before comments, so parents
+            # published in this cycle already show as published here.
+            posts_by_uuid = {
+                post['uuid']: post for post in self.storage.get_all_scheduled_posts()
+            }
+
             # Process each comment
             for comment in pending_comments:
                 comment_id = comment['id']
@@ -240,7 +400,7 @@ class SchedulerDaemon:
                     continue
 
                 # Get parent post
-                parent = self.storage.get_post_by_uuid(parent_uuid)
+                parent = posts_by_uuid.get(parent_uuid)
 
                 if not parent:
                     logger.error(f"Parent post {parent_uuid} not found for comment {comment_id}")
@@ -288,6 +448,8 @@ class SchedulerDaemon:
 
         except Exception as e:
             logger.error(f"Error processing pending comments: {e}", exc_info=True)
+        finally:
+            self._close_evicted_providers()
 
     def _execute_comment(self, comment_data: dict, parent_data: dict) -> bool:
         """Execute a single scheduled comment.
@@ -362,6 +524,8 @@ class SchedulerDaemon:
                 f"(parent: {parent_id}, scheduled: {scheduled_time}): {error_msg}",
                 exc_info=True
             )
+            if isinstance(e, AuthenticationError):
+                self._forget_provider(provider_name)
             return False
 
     def _process_pending_posts(self):
@@ -385,13 +549,39 @@ class SchedulerDaemon:
         while self.running:
             try:
                 self._process_pending_posts()
-                time.sleep(self.check_interval)
+                self._wait_for_next_check()
             except Exception as e:
                 logger.error(f"Unexpected error in scheduler loop: {e}", exc_info=True)
-                time.sleep(self.check_interval)
+                self._wait_for_next_check()
 
+        self._close_providers()
         logger.info("Scheduler daemon stopped")
 
+    def _next_wait_timeout(self) -> float:
+        """Return how long to wait before the next check (seconds).
+
+        This is check_interval, shortened when a pending item falls due sooner.
+        """
+        timeout = self.check_interval
+        if self._next_due_at is not None:
+            timeout = min(timeout, max(0.0, self._next_due_at - time.time()))
+        return timeout
+
+    def _wait_for_next_check(self):
+        """Wait until the next check, or until the daemon is stopped.
+
+        Sleeps in slices of at most _WAIT_SLICE seconds and rechecks the
+        running flag between them, so a stop request takes effect without
+        waiting out the whole interval. The signal handler only clears that
+        flag, which is safe to do from a handler.
+        """
+        deadline = time.monotonic() + self._next_wait_timeout()
+        while self.running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, _WAIT_SLICE))
+
     def run_once(self):
         """Process pending posts once without entering continuous loop.
 
@@ -399,4 +589,5 @@ class SchedulerDaemon:
         """
         logger.info("Running scheduler once...")
         self._process_pending_posts()
+        self._close_providers()
         logger.info("Scheduler run completed")
@@ -7,11 +7,12 @@ import logging
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
-import json
 import fcntl
 import os
 import uuid
 
+from socialcli.utils import jsoncodec
+
 
 class Storage:
     """Manages local storage for SocialCLI data."""
@@ -89,9 +90,8 @@ class Storage:
     def _init_scheduled_posts(self):
         """Initialize scheduled posts JSON file if it doesn't exist."""
         if not self.scheduled_posts_file.exists():
-            self.scheduled_posts_file.write_text(
-                json.dumps({"posts": []}, indent=2),
-                encoding='utf-8'
+            self.scheduled_posts_file.write_bytes(
+                jsoncodec.dumps({"posts": []}, pretty=True)
             )
 
     @staticmethod
@@ -103,6 +103,21 @@ class Storage:
         """
         return str(uuid.uuid4())
 
+    @staticmethod
+    def _publish_at_epoch(publish_at: Optional[str]) -> Optional[float]:
+        """Convert an ISO publish_at string to a POSIX timestamp.
+
+        Args:
+            publish_at: ISO format datetime string
+
+        Returns:
+            Timestamp, or None if publish_at is missing or not valid ISO
+        """
+        try:
+            return datetime.fromisoformat(publish_at).timestamp()
+        except (TypeError, ValueError):
+            return None
+
     def _ensure_post_fields(self, post: Dict[str, Any]) -> Dict[str, Any]:
         """Ensure post has all required fields (lazy migration).
 
@@ -149,15 +164,18 @@ class Storage:
     def _read_scheduled_posts(self) -> Dict[str, Any]:
         """Read scheduled posts from JSON file with file locking.
 
-        Performs lazy migration and builds UUID index.
+        Performs lazy migration and builds UUID index. Each post also gets a
+        publish_at_epoch timestamp derived from publish_at; it is never
+        saved, so publish_at (which users may edit by hand) stays the only
+        source of truth.
 
         Returns:
             Dictionary containing scheduled posts data
         """
-        with open(self.scheduled_posts_file, 'r', encoding='utf-8') as f:
+        with open(self.scheduled_posts_file, 'rb') as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_SH)
             try:
-                data = json.load(f)
+                data = jsoncodec.loads(f.read())
             finally:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
@@ -169,6 +187,9 @@ class Storage:
             if set(post.keys()) != original_keys:
                 migrated = True
 
+        for post in data['posts']:
+            post['publish_at_epoch'] = self._publish_at_epoch(post.get('publish_at'))
+
         # Build UUID index for O(1) lookups
         self._build_uuid_index(data['posts'])
 
@@ -181,15 +202,26 @@ class Storage:
     def _write_scheduled_posts(self, data: Dict[str, Any]):
         """Write scheduled posts to JSON file with file locking.
 
-        Rebuilds UUID index after writing.
+        Rebuilds UUID index after writing. The derived publish_at_epoch
+        field is left out of the file.
 
         Args:
             data: Dictionary containing scheduled posts data
         """
-        with open(self.scheduled_posts_file, 'w', encoding='utf-8') as f:
+        encoded = jsoncodec.dumps(
+            {
+                **data,
+                'posts': [
+                    {key: value for key, value in post.items() if key != 'publish_at_epoch'}
+                    for post in data['posts']
+                ],
+            },
+            pretty=True
+        )
+        with open(self.scheduled_posts_file, 'wb') as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_EX)
             try:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(encoded)
             finally:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
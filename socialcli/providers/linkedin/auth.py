@@ -5,9 +5,37 @@ Handles the OAuth 2.0 three-legged authentication flow for LinkedIn.
 
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
+import base64
+import binascii
+import json
 import requests
 from urllib.parse import urlencode
-from socialcli.core.config import Config
+from socialcli.core.config import Config, ProviderConfig
+
+
+def decode_jwt_claims(token: str) -> Optional[Dict[str, Any]]:
+    """Decode the payload of a JWT without verifying its signature.
+
+    LinkedIn access tokens are usually opaque; this only returns claims when
+    the token is a well-formed JWT.
+
+    Args:
+        token: Token string
+
+    Returns:
+        Dict of claims, or None if the token is not a decodable JWT
+    """
+    parts = token.split('.')
+    if len(parts) != 3:
+        return None
+
+    payload = parts[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+    except (ValueError, binascii.Error):
+        return None
+
+    return claims if isinstance(claims, dict) else None
 
 
 class LinkedInAuth:
@@ -16,6 +44,11 @@ class LinkedInAuth:
     AUTH_URL = "https://www.linkedin.com/oauth/v2/authorization"
     TOKEN_URL = "https://www.linkedin.com/oauth/v2/accessToken"
 
+    # OpenID Connect + Sign In with LinkedIn scopes (work with unverified apps)
+    DEFAULT_SCOPES = "openid profile email w_member_social"
+    # Pre-OpenID scopes for apps still provisioned with the legacy products
+    LEGACY_SCOPES = "w_member_social r_liteprofile"
+
     def __init__(
         self,
         client_id: str,
@@ -36,19 +69,22 @@ class LinkedInAuth:
         self.redirect_uri = redirect_uri
         self.config = config or Config()
 
-    def get_authorization_url(self, scope: Optional[str] = None) -> str:
+    def get_authorization_url(
+        self,
+        scope: Optional[str] = None,
+        legacy_scopes: bool = False
+    ) -> str:
         """Generate OAuth authorization URL.
 
         Args:
             scope: Space-separated OAuth scopes. Defaults to standard scopes.
+            legacy_scopes: Use the pre-OpenID default scopes (ignored if scope is given)
 
         Returns:
             Authorization URL for user to visit
         """
         if scope is None:
-            # Updated scopes for LinkedIn API v2 (OpenID Connect + Sign In with LinkedIn)
-            # These scopes work with unverified apps during development
-            scope = "openid profile email w_member_social"
+            scope = self.LEGACY_SCOPES if legacy_scopes else self.DEFAULT_SCOPES
 
         params = {
             'response_type': 'code',
@@ -108,20 +144,36 @@ class LinkedInAuth:
 
         return response.json()
 
-    def save_tokens(self, token_data: Dict[str, Any]) -> None:
+    def save_tokens(self, token_data: Dict[str, Any], keep_identity: bool = False) -> None:
         """Save access and refresh tokens to config.
 
         Args:
-            token_data: Dict containing access_token, expires_in, and optionally refresh_token
+            token_data: Dict containing access_token, expires_in, and optionally
+                refresh_token and id_token
+            keep_identity: Keep the cached member URN (True for token refreshes,
+                which always belong to the same member)
         """
-        # Calculate expiration timestamp
-        expires_in = token_data.get('expires_in', 5184000)  # Default 60 days
-        token_expiry = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
+        # Prefer the absolute exp claim when the access token is a JWT; it is
+        # immune to local clock skew. Otherwise fall back to expires_in.
+        # The id_token's exp is not used: it dates the ID token (about an
+        # hour), not the access token this expiry is tracked for.
+        claims = decode_jwt_claims(token_data['access_token'])
+        exp = claims.get('exp') if claims else None
+        token_expiry = None
+        # bool is an int subclass, but true/false is not a timestamp
+        if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+            try:
+                token_expiry = datetime.fromtimestamp(exp).isoformat()
+            except (OverflowError, OSError, ValueError):
+                # Out-of-range or NaN claim; fall back to expires_in below
+                pass
+        if token_expiry is None:
+            expires_in = token_data.get('expires_in', 5184000)  # Default 60 days
+            token_expiry = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
 
         # Get existing provider config or create new one
         provider_config = self.config.get_provider_config('linkedin')
         if provider_config is None:
-            from socialcli.core.config import ProviderConfig
             provider_config = ProviderConfig()
 
         # Update tokens
@@ -132,6 +184,16 @@ class LinkedInAuth:
         if 'refresh_token' in token_data:
             provider_config.refresh_token = token_data['refresh_token']
 
+        # A new authorization may belong to a different member. With the
+        # openid scope the response also carries an ID token whose sub claim
+        # is the member ID, which spares the first login a userinfo call.
+        if not keep_identity:
+            id_claims = decode_jwt_claims(token_data.get('id_token') or '')
+            sub = id_claims.get('sub') if id_claims else None
+            provider_config.person_urn = (
+                f"urn:li:person:{sub}" if isinstance(sub, str) and sub else None
+            )
+
         self.config.set_provider_config('linkedin', provider_config)
         self.config.save()
 
@@ -164,7 +226,7 @@ class LinkedInAuth:
                 if refresh_token:
                     try:
                         new_token_data = self.refresh_access_token(refresh_token)
-                        self.save_tokens(new_token_data)
+                        self.save_tokens(new_token_data, keep_identity=True)
                         return new_token_data['access_token']
                     except requests.HTTPError:
                         # Refresh failed, return None to trigger re-authentication
@@ -190,6 +252,7 @@ class LinkedInAuth:
             provider_config.access_token = None
             provider_config.refresh_token = None
             provider_config.token_expiry = None
+            provider_config.person_urn = None
 
             self.config.set_provider_config('linkedin', provider_config)
             self.config.save()
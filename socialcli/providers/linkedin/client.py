@@ -4,18 +4,89 @@ Handles HTTP communication with LinkedIn REST API including authentication,
 rate limiting, error handling, and retry logic.
 """
 
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, List
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+import random
+import threading
 import time
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
 from urllib3.util.retry import Retry
 
 from socialcli.providers.base import AuthenticationError
+from socialcli.utils import jsoncodec
+
+
+# Retry on specific status codes and connection errors. Only idempotent
+# methods are retried on 5xx: a POST that reached LinkedIn may already have
+# created a post, so retrying it risks duplicates.
+RETRY_STATUS_FORCELIST = frozenset({429, 500, 502, 503, 504})
+RETRY_ALLOWED_METHODS = frozenset({"HEAD", "GET", "OPTIONS"})
+
+# Connection pooling for sessions the client creates. All calls go to one
+# host, so few host pools are needed; each pool keeps a connection per
+# concurrent bulk() worker so the fan-out never overflows it.
+POOL_CONNECTIONS = 2
+MAX_BULK_WORKERS = 10
+
+
+class JitteredRetry(Retry):
+    """Retry whose exponential backoff gets a random extra delay.
+
+    Clients throttled at the same moment would otherwise all retry on the
+    same schedule and collide again; up to one backoff_factor of jitter
+    spreads them out. urllib3 only gained built-in jitter in 2.0.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.uniform(0, self.backoff_factor)
+
+
+class _ThrottleAwareRetry(JitteredRetry):
+    """Retry that also retries non-idempotent methods on HTTP 429.
+
+    A throttled request was rejected before any side effect, so it is safe
+    to resend regardless of method.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429 and self.total:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+@lru_cache(maxsize=None)
+def _get_retry_strategy(max_retries: int, backoff_factor: float) -> Retry:
+    """Return a shared Retry policy for the given settings.
+
+    Retry objects are never mutated (urllib3 derives a new one per attempt),
+    so one instance can safely back every client's HTTPAdapter.
+
+    Args:
+        max_retries: Maximum retry attempts
+        backoff_factor: Exponential backoff factor
+
+    Returns:
+        Retry configuration
+    """
+    return _ThrottleAwareRetry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
 
 
 class RateLimiter:
-    """Simple rate limiter for API requests."""
+    """Simple thread-safe rate limiter for API requests."""
 
     def __init__(self, max_requests: int = 100, time_window: int = 60):
         """Initialize rate limiter.
@@ -27,11 +98,32 @@ class RateLimiter:
         self.max_requests = max_requests
         self.time_window = time_window
         self.requests: list[float] = []
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
 
     def wait_if_needed(self) -> None:
         """Block if rate limit would be exceeded."""
+        with self._lock:
+            self._wait_locked()
+
+    def defer(self, seconds: float) -> None:
+        """Hold back all further requests for a server-requested delay.
+
+        Args:
+            seconds: Delay in seconds, e.g. from a Retry-After header
+        """
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.time() + seconds)
+
+    def _wait_locked(self) -> None:
+        """Apply the rate limit; caller must hold the lock."""
         now = time.time()
 
+        # Honour any back-off the server asked for
+        if self._resume_at > now:
+            time.sleep(self._resume_at - now)
+            now = time.time()
+
         # Remove requests older than time window
         self.requests = [req_time for req_time in self.requests
                         if now - req_time < self.time_window]
@@ -60,7 +152,15 @@ class LinkedInAPIClient:
     """
 
     API_BASE = "https://api.linkedin.com/v2"
-    API_REST_BASE = "https://api.linkedin.com/v2"
+    # Posts, comments and reshares are served from the same v2 base today
+    API_REST_BASE = API_BASE
+
+    # Headers sent with every API request besides Authorization
+    _BASE_HEADERS = {
+        'Content-Type': 'application/json',
+        'X-Restli-Protocol-Version': '2.0.0',
+        'LinkedIn-Version': '202504'
+    }
 
     # LinkedIn rate limits (conservative defaults)
     DEFAULT_RATE_LIMIT = 100  # requests per minute
@@ -72,7 +172,8 @@ class LinkedInAPIClient:
         rate_limit: int = DEFAULT_RATE_LIMIT,
         time_window: int = DEFAULT_TIME_WINDOW,
         max_retries: int = 3,
-        backoff_factor: float = 0.3
+        backoff_factor: float = 0.3,
+        session: Optional[requests.Session] = None
     ):
         """Initialize LinkedIn API client.
 
@@ -82,24 +183,45 @@ class LinkedInAPIClient:
             time_window: Rate limit time window in seconds (default 60)
             max_retries: Maximum retry attempts for failed requests (default 3)
             backoff_factor: Exponential backoff factor for retries (default 0.3)
+            session: Existing session to send requests on, so callers can share
+                one connection pool. Its adapters are left as configured by
+                the caller and close() does not close it. A new session with
+                a retrying adapter is created if None.
         """
         self.access_token = access_token
         self.rate_limiter = RateLimiter(rate_limit, time_window)
 
-        # Configure session with retry strategy
-        self.session = requests.Session()
+        # Precomputed base URL prefix; use_rest_api and v2 share the same base
+        self._base_url = self.API_BASE.rstrip('/') + '/'
 
-        # Retry on specific status codes and connection errors
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"]
-        )
+        # Still used to parse Retry-After on an injected session
+        self._retry = _get_retry_strategy(max_retries, backoff_factor)
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        # An injected session is shared: mounting an adapter would replace
+        # the pool and retry policy its owner and other clients rely on
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=MAX_BULK_WORKERS,
+                max_retries=self._retry
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """OAuth access token used for requests."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, access_token: Optional[str]) -> None:
+        self._access_token = access_token
+        # Built once per token rather than on every request and upload
+        self.auth_header = f'Bearer {access_token}' if access_token else None
 
     def _get_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Build request headers with authentication.
@@ -116,17 +238,34 @@ class LinkedInAPIClient:
         if not self.access_token:
             raise AuthenticationError("Access token not set. Please authenticate first.")
 
-        headers = {
-            'Authorization': f'Bearer {self.access_token}',
-            'X-Restli-Protocol-Version': '2.0.0',
-            'LinkedIn-Version': '202504'
-        }
+        headers = {'Authorization': self.auth_header, **self._BASE_HEADERS}
 
         if additional_headers:
             headers.update(additional_headers)
 
         return headers
 
+    def _apply_retry_after(self, response: requests.Response) -> None:
+        """Pause the rate limiter if the server asked us to back off.
+
+        Retries already honour Retry-After for the request that got it; this
+        keeps every other request from running into the same throttle.
+
+        Args:
+            response: HTTP response object
+        """
+        retry_after = response.headers.get('Retry-After')
+        if not retry_after:
+            return
+
+        try:
+            seconds = self._retry.parse_retry_after(retry_after)
+        except InvalidHeader:
+            return
+
+        if seconds > 0:
+            self.rate_limiter.defer(seconds)
+
     def _handle_error_response(self, response: requests.Response) -> None:
         """Handle API error responses with detailed error messages.
 
@@ -200,13 +339,19 @@ class LinkedInAPIClient:
         # Build full URL
         if base_url:
             url = f"{base_url}/{endpoint.lstrip('/')}"
+        elif endpoint.startswith('/'):
+            url = self._base_url + endpoint[1:]
         else:
-            api_base = self.API_REST_BASE if use_rest_api else self.API_BASE
-            url = f"{api_base}/{endpoint.lstrip('/')}"
+            url = self._base_url + endpoint
 
         # Build headers
         request_headers = self._get_headers(headers)
 
+        # Encode JSON payloads ourselves (orjson when available)
+        if json is not None:
+            data = jsoncodec.dumps(json)
+            json = None
+
         # Make request
         try:
             response = self.session.request(
@@ -221,6 +366,7 @@ class LinkedInAPIClient:
 
             # Handle errors
             if not response.ok:
+                self._apply_retry_after(response)
                 self._handle_error_response(response)
 
             return response
@@ -234,6 +380,35 @@ class LinkedInAPIClient:
                 f"Request failed: {str(e)}"
             )
 
+    def bulk(
+        self,
+        requests_list: List[Dict[str, Any]],
+        max_workers: int = MAX_BULK_WORKERS
+    ) -> List[requests.Response]:
+        """Make several independent requests concurrently.
+
+        Requests share the session and the rate limiter, so the configured
+        limits still apply across all worker threads.
+
+        Args:
+            requests_list: Keyword arguments for request() per call
+                (e.g. {'method': 'GET', 'endpoint': 'userinfo'})
+            max_workers: Maximum concurrent requests (default 10)
+
+        Returns:
+            HTTP responses in the same order as requests_list
+
+        Raises:
+            AuthenticationError: If authentication fails
+            requests.HTTPError: If any request fails after retries
+        """
+        if not requests_list:
+            return []
+
+        workers = min(max_workers, len(requests_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda kwargs: self.request(**kwargs), requests_list))
+
     def get(self, endpoint: str, **kwargs) -> requests.Response:
         """Make GET request.
 
@@ -291,8 +466,9 @@ class LinkedInAPIClient:
         self.access_token = access_token
 
     def close(self) -> None:
-        """Close the HTTP session."""
-        self.session.close()
+        """Close the HTTP session, unless it was injected by the caller."""
+        if self._owns_session:
+            self.session.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -3,10 +3,16 @@
 Implements the SocialProvider interface for LinkedIn.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO, Iterator, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+import logging
 import os
-import mimetypes
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote
 
 from socialcli.providers.base import (
@@ -17,9 +23,304 @@ from socialcli.providers.base import (
     RepostError,
     UploadError
 )
-from socialcli.providers.linkedin.client import LinkedInAPIClient
+from socialcli.providers.linkedin.client import (
+    LinkedInAPIClient,
+    JitteredRetry,
+    RETRY_STATUS_FORCELIST
+)
 from socialcli.providers.linkedin.auth import LinkedInAuth
 from socialcli.core.config import Config
+from socialcli.utils import jsoncodec
+
+
+logger = logging.getLogger(__name__)
+
+
+# Supported upload extensions -> (media type, Content-Type)
+MEDIA_TYPES_BY_EXTENSION: Dict[str, Tuple[str, str]] = {
+    '.jpg': ('image', 'image/jpeg'),
+    '.jpeg': ('image', 'image/jpeg'),
+    '.png': ('image', 'image/png'),
+    '.gif': ('image', 'image/gif'),
+    '.bmp': ('image', 'image/bmp'),
+    '.webp': ('image', 'image/webp'),
+    '.mp4': ('video', 'video/mp4'),
+    '.mov': ('video', 'video/quicktime'),
+    '.avi': ('video', 'video/x-msvideo'),
+    '.wmv': ('video', 'video/x-ms-wmv'),
+    '.flv': ('video', 'video/x-flv'),
+    '.webm': ('video', 'video/webm'),
+    '.mkv': ('video', 'video/x-matroska'),
+    '.pdf': ('document', 'application/pdf'),
+    '.doc': ('document', 'application/msword'),
+    '.docx': ('document', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
+    '.ppt': ('document', 'application/vnd.ms-powerpoint'),
+    '.pptx': ('document', 'application/vnd.openxmlformats-officedocument.presentationml.presentation'),
+}
+
+# LinkedIn accepts at most 20 images in a multiImage post
+MAX_MULTI_IMAGES = 20
+
+# Block size for streaming uploads to LinkedIn's upload URLs
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Concurrent uploads in upload_media_many; matches the upload session pool size
+MAX_UPLOAD_WORKERS = 4
+
+# Concurrent API calls in post_many/comment_many; the client's rate limiter
+# still caps the overall request rate
+MAX_BATCH_WORKERS = 8
+
+# Upload PUTs are idempotent and _FileChunks bodies rewind to the start on
+# retry, so throttling and server errors are retried like connection errors.
+# The final error response is returned so raise_for_status() reports it.
+UPLOAD_RETRY = JitteredRetry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=RETRY_STATUS_FORCELIST,
+    allowed_methods=frozenset({"PUT"}),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Fields shared by post and repost payloads; copied into each payload with
+# dict unpacking and never mutated (nested values are only serialized)
+_POST_BASE: Dict[str, Any] = {
+    "visibility": "PUBLIC",
+    "distribution": {
+        "feedDistribution": "MAIN_FEED",
+        "targetEntities": [],
+        "thirdPartyDistributionChannels": []
+    },
+    "lifecycleState": "PUBLISHED",
+    "isReshareDisabledByAuthor": False
+}
+
+# How long get_profile() reuses a fetched userinfo response (seconds)
+PROFILE_CACHE_TTL = 300
+
+# Member profiles fetched per batch GET in get_profiles()
+PROFILE_BATCH_SIZE = 50
+
+# URN prefixes for identities and uploaded media
+_PERSON_PREFIX = "urn:li:person:"
+_ASSET_PREFIX = "urn:li:digitalmediaAsset:"
+_DOCUMENT_PREFIX = "urn:li:document:"
+
+# Per media type (from MEDIA_TYPES_BY_EXTENSION): registerUpload recipe
+# and the URN prefix posts expect for the uploaded asset
+_RECIPE_BY_KIND = {
+    'image': "urn:li:digitalmediaRecipe:feedshare-image",
+    'video': "urn:li:digitalmediaRecipe:feedshare-video",
+}
+_URN_PREFIX_BY_KIND = {
+    'image': "urn:li:image:",
+    'video': "urn:li:video:",
+}
+
+
+def _media_info(file_path: str) -> Tuple[str, str]:
+    """Look up media type and Content-Type from a file's extension.
+
+    Args:
+        file_path: Path to media file
+
+    Returns:
+        Tuple of (media type, Content-Type)
+
+    Raises:
+        UploadError: If file type is unsupported
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    info = MEDIA_TYPES_BY_EXTENSION.get(ext)
+    if info is None:
+        raise UploadError(f"Unsupported file type: {ext}")
+    return info
+
+
+@lru_cache(maxsize=8)
+def _register_upload_payload(owner: str, recipe: str) -> Dict[str, Any]:
+    """Build the assets registerUpload request body.
+
+    The body only depends on the owner URN and recipe, so it is built once
+    and shared between uploads. Callers must not mutate the result.
+
+    Args:
+        owner: Person URN that owns the uploaded asset
+        recipe: Digital media recipe URN (feedshare image or video)
+
+    Returns:
+        registerUpload request payload
+    """
+    return {
+        "registerUploadRequest": {
+            "recipes": [recipe],
+            "owner": owner,
+            "serviceRelationships": [
+                {
+                    "relationshipType": "OWNER",
+                    "identifier": "urn:li:userGeneratedContent"
+                }
+            ]
+        }
+    }
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Normalize a single value or a sequence of values to a list.
+
+    Args:
+        value: None/empty, a single item, or a list or tuple of items
+
+    Returns:
+        List of items (empty for None or empty input)
+    """
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    return [value] if value else []
+
+
+def _media_content(media_ids: List[str], titles: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+    """Build the "content" section of a post for its attached media.
+
+    Args:
+        media_ids: Media URNs to attach
+        titles: Optional titles matching media_ids (used for documents)
+
+    Returns:
+        Content dict, or None if there is no media
+    """
+    if not media_ids:
+        return None
+
+    num_media = len(media_ids)
+    logger.info("Attaching %s media item(s)", num_media)
+
+    if num_media >= 2:
+        # Multiple images: use multiImage format (2-20 images)
+        if num_media > MAX_MULTI_IMAGES:
+            logger.warning(
+                "LinkedIn allows at most %s images per post; dropping %s",
+                MAX_MULTI_IMAGES, num_media - MAX_MULTI_IMAGES
+            )
+        return {
+            "multiImage": {
+                "images": [
+                    {"id": media_id}
+                    for media_id in islice(media_ids, MAX_MULTI_IMAGES)
+                ]
+            }
+        }
+
+    if media_ids[0].startswith(_DOCUMENT_PREFIX):
+        # Document: requires title field, generic one unless provided
+        return {
+            "media": {
+                "title": titles[0] if titles else 'Document',
+                "id": media_ids[0]
+            }
+        }
+
+    # Single image/video: simple media format with just ID
+    return {"media": {"id": media_ids[0]}}
+
+
+@lru_cache(maxsize=1024)
+def _encode_urn(urn: str) -> str:
+    """Percent-encode a URN for use as a URL path segment.
+
+    Scheduled comments and status checks hit the same post URNs repeatedly,
+    so encodings are memoized.
+
+    Args:
+        urn: LinkedIn URN (e.g. 'urn:li:share:123')
+
+    Returns:
+        URN with every reserved character escaped
+    """
+    return quote(urn, safe='')
+
+
+def _json_body(response: requests.Response) -> Dict[str, Any]:
+    """Decode a JSON response body, treating an empty body as {}.
+
+    Checks the raw bytes rather than response.text, which would decode the
+    body to str only for response.json() to decode it again.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Decoded body, or an empty dict if the body is empty
+    """
+    body = response.content
+    return jsoncodec.loads(body) if body else {}
+
+
+def _prefetch_file(file_obj: BinaryIO) -> None:
+    """Ask the kernel to start reading a file into the page cache.
+
+    Called before the upload registration round-trip, so by the time the
+    PUT streams the file its blocks are usually already in memory.
+
+    Args:
+        file_obj: File opened for the upload
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(file_obj.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass  # Only a hint; the upload reads the file either way
+
+
+def _log_response_debug(label: str, response: requests.Response) -> None:
+    """Log a response's headers and body at DEBUG level.
+
+    Building the headers dict and decoding the body are skipped entirely
+    unless DEBUG logging is enabled.
+
+    Args:
+        label: Message prefix (e.g. 'Upload response')
+        response: HTTP response to log
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s headers: %s", label, dict(response.headers))
+        logger.debug("%s body: %s", label, response.text)
+
+
+class _FileChunks:
+    """Iterable upload body that reads a file in large blocks.
+
+    Handing requests the raw file object makes urllib3 read it in small
+    blocks; large blocks mean far fewer Python iterations and send() calls.
+    Exposing __len__ keeps requests from switching to chunked encoding, and
+    tell()/seek() let urllib3 rewind the body when it retries the request.
+    """
+
+    def __init__(self, file_obj: BinaryIO, size: int, chunk_size: int = UPLOAD_CHUNK_SIZE):
+        self._file = file_obj
+        self._size = size
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def __iter__(self) -> Iterator[bytes]:
+        read = self._file.read
+        while True:
+            chunk = read(self._chunk_size)
+            if not chunk:
+                return
+            yield chunk
 
 
 class LinkedInProvider(SocialProvider):
@@ -50,6 +351,13 @@ class LinkedInProvider(SocialProvider):
         self.config = config or Config()
         self._user_id = None
         self._person_urn = None
+        self._login_lock = threading.Lock()
+        # (access token, fetch time, userinfo) from the last get_profile()
+        self._profile_cache: Optional[Tuple[str, float, Dict[str, Any]]] = None
+
+        # Keep-alive session for direct file uploads, created on first upload
+        self._upload_session: Optional[requests.Session] = None
+        self._upload_session_lock = threading.Lock()
 
         # Initialize auth if credentials provided
         self.auth = None
@@ -68,9 +376,51 @@ class LinkedInProvider(SocialProvider):
             # Try to get valid token from config
             valid_token = self.auth.get_valid_token()
             self.client = LinkedInAPIClient(access_token=valid_token)
+
+            # Reuse the member URN resolved by a previous session
+            provider_config = self.config.get_provider_config('linkedin')
+            if valid_token and provider_config and provider_config.person_urn:
+                self._person_urn = provider_config.person_urn
+                self._user_id = self._person_urn.rpartition(':')[2]
         else:
             self.client = LinkedInAPIClient()
 
+    def close(self) -> None:
+        """Close the API client and upload sessions."""
+        self.client.close()
+        if self._upload_session is not None:
+            self._upload_session.close()
+            self._upload_session = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def _get_upload_session(self) -> requests.Session:
+        """Return the session used for PUTs to LinkedIn's upload URLs.
+
+        Created on first use so providers that never upload skip the setup.
+        Repeated uploads reuse its pooled TCP/TLS connections.
+
+        Returns:
+            Shared upload session
+        """
+        if self._upload_session is None:
+            with self._upload_session_lock:
+                if self._upload_session is None:
+                    session = requests.Session()
+                    session.mount("https://", HTTPAdapter(
+                        pool_connections=MAX_UPLOAD_WORKERS,
+                        pool_maxsize=MAX_UPLOAD_WORKERS,
+                        max_retries=UPLOAD_RETRY
+                    ))
+                    self._upload_session = session
+        return self._upload_session
+
     def login(self) -> bool:
         """Verify authentication by fetching user profile.
 
@@ -87,11 +437,32 @@ class LinkedInProvider(SocialProvider):
             profile = self.get_profile()
             self._user_id = profile.get('id')
             # Store person URN for use in posts
-            self._person_urn = f"urn:li:person:{self._user_id}"
-            return True
+            self._person_urn = _PERSON_PREFIX + self._user_id
         except Exception as e:
             raise AuthenticationError(f"Login failed: {str(e)}")
 
+        # Persist the URN so later sessions can skip the profile round-trip
+        provider_config = self.config.get_provider_config('linkedin')
+        if provider_config is not None and provider_config.person_urn != self._person_urn:
+            self.config.update_person_urn('linkedin', self._person_urn)
+
+        return True
+
+    def _ensure_logged_in(self) -> None:
+        """Log in unless the member URN is already known.
+
+        Concurrent callers share one login() call instead of each fetching
+        the profile.
+
+        Raises:
+            AuthenticationError: If authentication fails
+        """
+        if self._person_urn:
+            return
+        with self._login_lock:
+            if not self._person_urn:
+                self.login()
+
     def post(self, content: str, **kwargs) -> Dict[str, Any]:
         """Create a LinkedIn post using the REST API.
 
@@ -111,74 +482,32 @@ class LinkedInProvider(SocialProvider):
             AuthenticationError: If not authenticated
             PostError: If post creation fails
         """
-        if not self._person_urn:
-            self.login()
+        self._ensure_logged_in()
 
         # Allow override for organization posts
         author_urn = kwargs.get('author_urn', self._person_urn)
 
         # Debug: log content before sending
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Posting content (length: {len(content)} chars)")
-        logger.debug(f"Full content:\n{content}")
+        logger.info("Posting content (length: %s chars)", len(content))
+        logger.debug("Full content:\n%s", content)
 
         # Build post payload for REST API
+        media_content = _media_content(
+            _as_list(kwargs.get('media_ids')), kwargs.get('media_titles')
+        )
         post_data = {
+            **_POST_BASE,
             "author": author_urn,
             "commentary": content,
             "visibility": kwargs.get('visibility', 'PUBLIC'),
-            "distribution": {
-                "feedDistribution": "MAIN_FEED",
-                "targetEntities": [],
-                "thirdPartyDistributionChannels": []
-            },
-            "lifecycleState": "PUBLISHED",
-            "isReshareDisabledByAuthor": False
+            **({"content": media_content} if media_content else {})
         }
 
-        # Add media if provided
-        if 'media_ids' in kwargs and kwargs['media_ids']:
-            media_ids = kwargs['media_ids'] if isinstance(kwargs['media_ids'], list) else [kwargs['media_ids']]
-
-            if media_ids:
-                num_media = len(media_ids)
-                logger.info(f"Attaching {num_media} media item(s)")
-
-                # Check if first media is a document (different format required)
-                is_document = media_ids[0].startswith('urn:li:document:')
-
-                if is_document and num_media == 1:
-                    # Document: requires title field
-                    # Extract filename from kwargs if provided, otherwise use generic title
-                    document_title = kwargs.get('media_titles', ['Document'])[0] if 'media_titles' in kwargs else 'Document'
-                    post_data["content"] = {
-                        "media": {
-                            "title": document_title,
-                            "id": media_ids[0]
-                        }
-                    }
-                elif num_media >= 2:
-                    # Multiple images: use multiImage format (2-20 images)
-                    post_data["content"] = {
-                        "multiImage": {
-                            "images": [
-                                {"id": media_id}
-                                for media_id in media_ids[:20]  # LinkedIn supports up to 20
-                            ]
-                        }
-                    }
-                else:
-                    # Single image/video: simple media format with just ID
-                    post_data["content"] = {
-                        "media": {
-                            "id": media_ids[0]
-                        }
-                    }
-
-        # Debug: log payload
-        import json
-        logger.debug(f"Request payload:\n{json.dumps(post_data, indent=2, ensure_ascii=False)}")
+        # Debug: log payload (skip the pretty-print entirely unless DEBUG is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Request payload:\n%s", jsoncodec.dumps(post_data, pretty=True).decode('utf-8')
+            )
 
         try:
             response = self.client.post(
@@ -187,18 +516,17 @@ class LinkedInProvider(SocialProvider):
                 json=post_data
             )
 
-            logger.info(f"Response status: {response.status_code}")
-            logger.debug(f"Response headers: {dict(response.headers)}")
-            logger.debug(f"Response body: {response.text}")
+            logger.info("Response status: %s", response.status_code)
+            _log_response_debug("Response", response)
 
             # Extract post ID from response headers or body
-            result = response.json() if response.text else {}
+            result = _json_body(response)
 
             # LinkedIn REST API returns post ID in x-restli-id header
             post_id = response.headers.get('x-restli-id')
             if post_id:
                 result['id'] = post_id
-                logger.info(f"Post created with ID: {post_id}")
+                logger.info("Post created with ID: %s", post_id)
 
             return result
 
@@ -228,8 +556,7 @@ class LinkedInProvider(SocialProvider):
             AuthenticationError: If not authenticated
             CommentError: If comment creation fails
         """
-        if not self._person_urn:
-            self.login()
+        self._ensure_logged_in()
 
         # Build comment payload for REST API
         comment_data = {
@@ -242,7 +569,7 @@ class LinkedInProvider(SocialProvider):
 
         try:
             # URL-encode the URN for use in the path
-            encoded_urn = quote(target_id, safe='')
+            encoded_urn = _encode_urn(target_id)
             response = self.client.post(
                 f"socialActions/{encoded_urn}/comments",
                 use_rest_api=True,
@@ -250,7 +577,7 @@ class LinkedInProvider(SocialProvider):
             )
 
             # Extract comment ID from response
-            result = response.json() if response.text else {}
+            result = _json_body(response)
 
             # LinkedIn REST API returns comment ID in x-restli-id header
             comment_id = response.headers.get('x-restli-id')
@@ -280,21 +607,13 @@ class LinkedInProvider(SocialProvider):
             AuthenticationError: If not authenticated
             RepostError: If repost fails
         """
-        if not self._person_urn:
-            self.login()
+        self._ensure_logged_in()
 
         # Build repost payload for REST API
         share_data = {
+            **_POST_BASE,
             "author": self._person_urn,
             "commentary": text or "",
-            "visibility": "PUBLIC",
-            "distribution": {
-                "feedDistribution": "MAIN_FEED",
-                "targetEntities": [],
-                "thirdPartyDistributionChannels": []
-            },
-            "lifecycleState": "PUBLISHED",
-            "isReshareDisabledByAuthor": False,
             "reshareContext": {
                 "parent": target_id
             }
@@ -307,7 +626,7 @@ class LinkedInProvider(SocialProvider):
                 json=share_data
             )
 
-            result = response.json() if response.text else {}
+            result = _json_body(response)
 
             # Extract post ID from response header
             post_id = response.headers.get('x-restli-id')
@@ -323,49 +642,6 @@ class LinkedInProvider(SocialProvider):
         except Exception as e:
             raise RepostError(f"Unexpected error creating repost: {str(e)}")
 
-    def _detect_media_type(self, file_path: str) -> str:
-        """Detect media type from file path.
-
-        Args:
-            file_path: Path to media file
-
-        Returns:
-            Media type: 'image', 'video', or 'document'
-
-        Raises:
-            UploadError: If file type is unsupported
-        """
-        if not os.path.exists(file_path):
-            raise UploadError(f"File not found: {file_path}")
-
-        # Get MIME type
-        mime_type, _ = mimetypes.guess_type(file_path)
-
-        if mime_type is None:
-            # Fallback to extension check
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']:
-                return 'image'
-            elif ext in ['.mp4', '.mov', '.avi', '.wmv', '.flv', '.webm', '.mkv']:
-                return 'video'
-            elif ext in ['.pdf', '.doc', '.docx', '.ppt', '.pptx']:
-                return 'document'
-            else:
-                raise UploadError(f"Unsupported file type: {ext}")
-
-        # Check MIME type
-        if mime_type.startswith('image/'):
-            return 'image'
-        elif mime_type.startswith('video/'):
-            return 'video'
-        elif mime_type in ['application/pdf', 'application/msword',
-                          'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                          'application/vnd.ms-powerpoint',
-                          'application/vnd.openxmlformats-officedocument.presentationml.presentation']:
-            return 'document'
-        else:
-            raise UploadError(f"Unsupported media type: {mime_type}")
-
     def upload_media(self, file_path: str) -> str:
         """Upload image or video to LinkedIn using the client.
 
@@ -383,43 +659,41 @@ class LinkedInProvider(SocialProvider):
             AuthenticationError: If not authenticated
             UploadError: If upload fails or file type is unsupported
         """
-        import logging
-        logger = logging.getLogger(__name__)
 
-        if not self._person_urn:
-            self.login()
+        self._ensure_logged_in()
+
+        # Single stat serves both the existence check and Content-Length
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise UploadError(f"File not found: {file_path}")
 
-        # Detect media type
-        media_type = self._detect_media_type(file_path)
+        # Detect media type and upload Content-Type in one lookup
+        media_type, content_type = _media_info(file_path)
 
         # Route documents to document upload API
         if media_type == 'document':
-            return self.upload_document(file_path)
+            return self._upload_document(file_path, st.st_size)
 
         # Select appropriate recipe based on media type (image/video)
-        if media_type == 'image':
-            recipe = "urn:li:digitalmediaRecipe:feedshare-image"
-        else:  # video
-            recipe = "urn:li:digitalmediaRecipe:feedshare-video"
+        recipe = _RECIPE_BY_KIND[media_type]
 
         # Register upload using v2 API (assets endpoint still uses v2)
-        register_data = {
-            "registerUploadRequest": {
-                "recipes": [recipe],
-                "owner": self._person_urn,
-                "serviceRelationships": [
-                    {
-                        "relationshipType": "OWNER",
-                        "identifier": "urn:li:userGeneratedContent"
-                    }
-                ]
-            }
-        }
+        register_data = _register_upload_payload(self._person_urn, recipe)
 
+        # Open the file before registering, so an unreadable file fails
+        # without leaving an orphaned asset registration behind
         try:
+            f = open(file_path, 'rb')
+        except OSError as e:
+            raise UploadError(f"Cannot read file {file_path}: {e}")
+
+        try:
+            _prefetch_file(f)
+
             # Register upload with v2 API
-            logger.debug(f"Registering upload for file: {file_path}")
-            logger.debug(f"Registration payload: {register_data}")
+            logger.debug("Registering upload for file: %s", file_path)
+            logger.debug("Registration payload: %s", register_data)
 
             response = self.client.post(
                 "assets?action=registerUpload",
@@ -427,61 +701,49 @@ class LinkedInProvider(SocialProvider):
                 json=register_data
             )
 
-            logger.debug(f"Registration response status: {response.status_code}")
-            logger.debug(f"Registration response headers: {dict(response.headers)}")
-            logger.debug(f"Registration response body: {response.text}")
+            logger.debug("Registration response status: %s", response.status_code)
+            _log_response_debug("Registration response", response)
 
-            upload_info = response.json()
+            upload_info = jsoncodec.loads(response.content)
 
             upload_url = upload_info['value']['uploadMechanism'][
                 'com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest'
             ]['uploadUrl']
 
             asset_urn = upload_info['value']['asset']
-            logger.debug(f"Upload URL: {upload_url}")
-            logger.debug(f"Asset URN: {asset_urn}")
+            logger.debug("Upload URL: %s", upload_url)
+            logger.debug("Asset URN: %s", asset_urn)
 
             # Upload file directly to LinkedIn's upload URL
-            # Get file size for Content-Length header
-            file_size = os.path.getsize(file_path)
+            file_size = st.st_size
 
-            with open(file_path, 'rb') as f:
-                headers = {
-                    'Authorization': f'Bearer {self.client.access_token}',
-                    'Content-Length': str(file_size)
-                }
-
-                # Videos may require additional headers
-                if media_type == 'video':
-                    mime_type, _ = mimetypes.guess_type(file_path)
-                    if mime_type:
-                        headers['Content-Type'] = mime_type
+            headers = {
+                'Authorization': self.client.auth_header,
+                'Content-Length': str(file_size),
+                # Always declare the type so the upload endpoint doesn't sniff it
+                'Content-Type': content_type
+            }
 
-                logger.debug(f"Uploading file to LinkedIn, size: {file_size} bytes")
-                logger.debug(f"Upload headers: {headers}")
+            logger.debug("Uploading file to LinkedIn, size: %s bytes", file_size)
+            logger.debug("Upload headers: %s", headers)
 
-                upload_response = requests.put(
-                    upload_url,
-                    data=f,
-                    headers=headers
-                )
+            upload_response = self._get_upload_session().put(
+                upload_url,
+                data=_FileChunks(f, file_size),
+                headers=headers
+            )
 
-                logger.debug(f"Upload response status: {upload_response.status_code}")
-                logger.debug(f"Upload response headers: {dict(upload_response.headers)}")
-                logger.debug(f"Upload response body: {upload_response.text}")
+            logger.debug("Upload response status: %s", upload_response.status_code)
+            _log_response_debug("Upload response", upload_response)
 
-                upload_response.raise_for_status()
+            upload_response.raise_for_status()
 
             # Convert digitalmediaAsset URN to image/video URN
             # LinkedIn expects urn:li:image:... or urn:li:video:... for posts
             # Extract the ID from the asset URN and create the correct type
-            if asset_urn.startswith('urn:li:digitalmediaAsset:'):
-                asset_id = asset_urn.split(':')[-1]
-                if media_type == 'image':
-                    media_urn = f"urn:li:image:{asset_id}"
-                else:
-                    media_urn = f"urn:li:video:{asset_id}"
-                return media_urn
+            if asset_urn.startswith(_ASSET_PREFIX):
+                asset_id = asset_urn.rpartition(':')[2]
+                return _URN_PREFIX_BY_KIND[media_type] + asset_id
 
             # Fallback: return asset URN as-is
             return asset_urn
@@ -501,6 +763,95 @@ class LinkedInProvider(SocialProvider):
         except Exception as e:
             logger.error(f"Unexpected error during upload: {e}", exc_info=True)
             raise UploadError(f"Failed to upload media: {str(e)}")
+        finally:
+            f.close()
+
+    def upload_media_many(
+        self,
+        file_paths: List[str],
+        max_workers: int = MAX_UPLOAD_WORKERS
+    ) -> List[str]:
+        """Upload several media files concurrently.
+
+        Each upload is a register call followed by a PUT, so the time is
+        spent waiting on the network; running uploads on a small thread pool
+        cuts wall time for multi-image posts.
+
+        Args:
+            file_paths: Paths to media files
+            max_workers: Maximum concurrent uploads (default 4)
+
+        Returns:
+            Media URNs in the same order as file_paths
+
+        Raises:
+            AuthenticationError: If not authenticated
+            UploadError: If any upload fails
+        """
+        return self._run_batch(self.upload_media, file_paths, max_workers)
+
+    def post_many(
+        self,
+        items: List[Dict[str, Any]],
+        max_workers: int = MAX_BATCH_WORKERS
+    ) -> List[Dict[str, Any]]:
+        """Create several posts concurrently.
+
+        Args:
+            items: Keyword arguments for post(), each including 'content'
+            max_workers: Maximum concurrent requests (default 8)
+
+        Returns:
+            Post details in the same order as items
+
+        Raises:
+            AuthenticationError: If not authenticated
+            PostError: If any post fails; posts that already succeeded
+                stay published
+        """
+        return self._run_batch(lambda item: self.post(**item), items, max_workers)
+
+    def comment_many(
+        self,
+        comments: List[Tuple[str, str]],
+        max_workers: int = MAX_BATCH_WORKERS
+    ) -> List[Dict[str, Any]]:
+        """Add several comments concurrently.
+
+        Args:
+            comments: (target_id, text) pairs, as accepted by comment()
+            max_workers: Maximum concurrent requests (default 8)
+
+        Returns:
+            Comment details in the same order as comments
+
+        Raises:
+            AuthenticationError: If not authenticated
+            CommentError: If any comment fails; comments that already
+                succeeded stay published
+        """
+        return self._run_batch(lambda pair: self.comment(*pair), comments, max_workers)
+
+    def _run_batch(self, func, items: List[Any], max_workers: int) -> List[Any]:
+        """Apply func to each item on a thread pool, preserving order.
+
+        Args:
+            func: Provider method to call for each item
+            items: Inputs for func
+            max_workers: Maximum concurrent calls
+
+        Returns:
+            Results in the same order as items; the first failure is raised
+        """
+        if not items:
+            return []
+
+        # Resolve the member URN up front rather than in each worker
+        self._ensure_logged_in()
+
+        workers = min(max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
 
     def upload_document(self, file_path: str) -> str:
         """Upload document (PDF, DOC, PPT, etc.) to LinkedIn using Documents API.
@@ -518,23 +869,37 @@ class LinkedInProvider(SocialProvider):
             AuthenticationError: If not authenticated
             UploadError: If upload fails or file is invalid
         """
-        import logging
-        logger = logging.getLogger(__name__)
 
-        if not self._person_urn:
-            self.login()
+        self._ensure_logged_in()
 
-        # Validate file
-        if not os.path.exists(file_path):
+        # Validate file; one stat gives both existence and size
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             raise UploadError(f"File not found: {file_path}")
 
-        file_size = os.path.getsize(file_path)
+        return self._upload_document(file_path, st.st_size)
+
+    def _upload_document(self, file_path: str, file_size: int) -> str:
+        """Upload a document whose size the caller has already read.
+
+        Args:
+            file_path: Path to document file
+            file_size: Size of the file in bytes
+
+        Returns:
+            Document URN for use in posts (urn:li:document:xxx)
+
+        Raises:
+            AuthenticationError: If not authenticated
+            UploadError: If upload fails or file is too large
+        """
         max_size = 100 * 1024 * 1024  # 100MB
 
         if file_size > max_size:
             raise UploadError(f"File too large: {file_size} bytes (max: {max_size})")
 
-        logger.debug(f"Uploading document: {file_path} ({file_size} bytes)")
+        logger.debug("Uploading document: %s (%s bytes)", file_path, file_size)
 
         try:
             # Step 1: Initialize document upload
@@ -544,7 +909,7 @@ class LinkedInProvider(SocialProvider):
                 }
             }
 
-            logger.debug(f"Initializing document upload with payload: {init_data}")
+            logger.debug("Initializing document upload with payload: %s", init_data)
 
             # Use /rest base URL (not /v2) with required headers
             init_response = self.client.post(
@@ -557,38 +922,37 @@ class LinkedInProvider(SocialProvider):
                 }
             )
 
-            logger.debug(f"Initialize response status: {init_response.status_code}")
-            logger.debug(f"Initialize response headers: {dict(init_response.headers)}")
-            logger.debug(f"Initialize response body: {init_response.text}")
+            logger.debug("Initialize response status: %s", init_response.status_code)
+            _log_response_debug("Initialize response", init_response)
 
-            init_result = init_response.json()
+            init_result = jsoncodec.loads(init_response.content)
             upload_url = init_result['value']['uploadUrl']
             document_urn = init_result['value']['document']
 
-            logger.debug(f"Upload URL: {upload_url}")
-            logger.debug(f"Document URN: {document_urn}")
+            logger.debug("Upload URL: %s", upload_url)
+            logger.debug("Document URN: %s", document_urn)
 
             # Step 2: Upload file to the provided URL
             with open(file_path, 'rb') as f:
                 headers = {
-                    'Authorization': f'Bearer {self.client.access_token}'
+                    'Authorization': self.client.auth_header,
+                    'Content-Length': str(file_size)
                 }
 
-                logger.debug(f"Uploading file to LinkedIn, size: {file_size} bytes")
+                logger.debug("Uploading file to LinkedIn, size: %s bytes", file_size)
 
-                upload_response = requests.put(
+                upload_response = self._get_upload_session().put(
                     upload_url,
-                    data=f,
+                    data=_FileChunks(f, file_size),
                     headers=headers
                 )
 
-                logger.debug(f"Upload response status: {upload_response.status_code}")
-                logger.debug(f"Upload response headers: {dict(upload_response.headers)}")
-                logger.debug(f"Upload response body: {upload_response.text}")
+                logger.debug("Upload response status: %s", upload_response.status_code)
+                _log_response_debug("Upload response", upload_response)
 
                 upload_response.raise_for_status()
 
-            logger.info(f"Document uploaded successfully: {document_urn}")
+            logger.info("Document uploaded successfully: %s", document_urn)
             return document_urn
 
         except AuthenticationError:
@@ -618,9 +982,22 @@ class LinkedInProvider(SocialProvider):
                 - family_name: User's last name
                 - email: User's email address
 
+        Responses are cached for PROFILE_CACHE_TTL seconds per access token.
+
         Raises:
             AuthenticationError: If not authenticated
         """
+        cached = self._profile_cache
+        if (
+            cached is not None
+            and cached[0] == self.client.access_token
+            and time.monotonic() - cached[1] < PROFILE_CACHE_TTL
+        ):
+            return dict(cached[2])
+
+        # Drop the cache up front so a failed fetch never leaves stale data
+        self._profile_cache = None
+
         try:
             # Use OpenID Connect userinfo endpoint instead of deprecated /v2/me
             # This endpoint works with openid, profile, email scopes
@@ -628,14 +1005,15 @@ class LinkedInProvider(SocialProvider):
                 "userinfo",
                 use_rest_api=False  # Uses v2 base URL: https://api.linkedin.com/v2/userinfo
             )
-            profile_data = response.json()
+            profile_data = jsoncodec.loads(response.content)
 
             # Map OpenID Connect fields to expected format for backward compatibility
             # 'sub' is the LinkedIn member ID in OpenID Connect
             if 'sub' in profile_data and 'id' not in profile_data:
                 profile_data['id'] = profile_data['sub']
 
-            return profile_data
+            self._profile_cache = (self.client.access_token, time.monotonic(), profile_data)
+            return dict(profile_data)
         except AuthenticationError:
             raise
         except requests.HTTPError as e:
@@ -643,6 +1021,64 @@ class LinkedInProvider(SocialProvider):
         except Exception as e:
             raise AuthenticationError(f"Unexpected error getting profile: {str(e)}")
 
+    def get_profiles(self, urns: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several member profiles with batched requests.
+
+        Uses the Rest.li batch GET syntax (ids=List(...)) so up to
+        PROFILE_BATCH_SIZE profiles are fetched per request instead of one
+        request each. Reading other members' profiles requires an app with
+        access to the People API.
+
+        Args:
+            urns: Person URNs (e.g., 'urn:li:person:abc123'); duplicates
+                are fetched once
+
+        Returns:
+            Dict mapping each URN to its profile; URNs LinkedIn did not
+            return a profile for are omitted
+
+        Raises:
+            AuthenticationError: If not authenticated
+            ValueError: If a URN is not a person URN
+            Exception: If a batch request fails
+        """
+        member_ids = {}
+        for urn in urns:
+            if not urn.startswith(_PERSON_PREFIX):
+                raise ValueError(f"Not a person URN: {urn}")
+            member_ids.setdefault(urn, urn[len(_PERSON_PREFIX):])
+
+        if not member_ids:
+            return {}
+
+        self._ensure_logged_in()
+
+        profiles = {}
+        pending = iter(member_ids.items())
+        while True:
+            batch = list(islice(pending, PROFILE_BATCH_SIZE))
+            if not batch:
+                return profiles
+
+            # Rest.li keys are (id:<member id>); build the query by hand since
+            # requests would percent-encode the List(...) syntax
+            keys = {f"(id:{quote(member_id, safe='')})": urn for urn, member_id in batch}
+            try:
+                response = self.client.get(
+                    f"people?ids=List({','.join(keys)})",
+                    use_rest_api=True
+                )
+                results = _json_body(response).get('results', {})
+            except AuthenticationError:
+                raise
+            except Exception as e:
+                logger.error(f"Error retrieving profiles: {e}", exc_info=True)
+                raise Exception(f"Failed to retrieve profiles: {str(e)}")
+
+            for key, profile in results.items():
+                if key in keys:
+                    profiles[keys[key]] = profile
+
     def get_post(self, post_urn: str) -> Dict[str, Any]:
         """Get a specific post by URN to check its status.
 
@@ -656,19 +1092,15 @@ class LinkedInProvider(SocialProvider):
             AuthenticationError: If not authenticated
             Exception: If post retrieval fails
         """
-        import logging
-        logger = logging.getLogger(__name__)
 
-        if not self._person_urn:
-            self.login()
+        self._ensure_logged_in()
 
         try:
             # URL encode the URN for the API path
-            from urllib.parse import quote
-            encoded_urn = quote(post_urn, safe='')
+            encoded_urn = _encode_urn(post_urn)
 
-            logger.debug(f"Retrieving post: {post_urn}")
-            logger.debug(f"Encoded URN: {encoded_urn}")
+            logger.debug("Retrieving post: %s", post_urn)
+            logger.debug("Encoded URN: %s", encoded_urn)
 
             # Use REST API to get the post
             response = self.client.get(
@@ -676,11 +1108,10 @@ class LinkedInProvider(SocialProvider):
                 use_rest_api=True
             )
 
-            logger.debug(f"Get post response status: {response.status_code}")
-            logger.debug(f"Get post response headers: {dict(response.headers)}")
-            logger.debug(f"Get post response body: {response.text}")
+            logger.debug("Get post response status: %s", response.status_code)
+            _log_response_debug("Get post response", response)
 
-            post_data = response.json()
+            post_data = jsoncodec.loads(response.content)
             return post_data
 
         except AuthenticationError:
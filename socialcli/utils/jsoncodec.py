@@ -0,0 +1,51 @@
+"""JSON encoding and decoding helpers.
+
+Uses orjson when it is installed (``pip install socialcli[fast]``) and falls
+back to the standard library otherwise. Both paths produce UTF-8 bytes.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent output by two spaces (for logs and human-edited files)
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, allow_nan=False).encode('utf-8')
+    return json.dumps(
+        obj, separators=(',', ':'), ensure_ascii=False, allow_nan=False
+    ).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Decoded object
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
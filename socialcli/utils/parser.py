@@ -3,12 +3,65 @@
 Handles parsing of post files with optional YAML front matter.
 """
 
+import copy
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 import yaml
 
+# libyaml's C loader is several times faster; PyYAML wheels normally ship it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# YAML front matter between '---' lines, followed by the post body
+_FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+
+
+@lru_cache(maxsize=512)
+def _parse_file(path: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], str]:
+    """Read and parse a post file, cached on its modification time and size.
+
+    The scheduler re-parses the same files every cycle; an edited file gets
+    a new mtime/size and so a new cache entry.
+
+    Args:
+        path: Absolute path to the post file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Tuple of (metadata, content); callers must copy metadata before use
+
+    Raises:
+        ValueError: If the front matter is not valid YAML
+    """
+    file_content = Path(path).read_bytes().decode('utf-8')
+    # Same newline handling as text mode, but only paid for files with '\r'
+    if '\r' in file_content:
+        file_content = file_content.replace('\r\n', '\n').replace('\r', '\n')
+
+    # Check for YAML front matter; the prefix test skips the regex
+    # for plain posts, which cannot match it
+    match = file_content.startswith('---') and _FRONT_MATTER_RE.match(file_content)
+
+    if not match:
+        # No front matter, entire file is content
+        return {}, file_content.strip()
+
+    # Parse YAML front matter
+    try:
+        metadata = yaml.load(match.group(1), Loader=_YamlLoader) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML front matter: {e}")
+
+    return metadata, match.group(2).strip()
+
 
 class PostParser:
     """Parses post files with optional front matter."""
@@ -27,28 +80,51 @@ class PostParser:
 
     def _parse(self):
         """Parse the post file."""
-        if not self.file_path.exists():
+        try:
+            st = self.file_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Post file not found: {self.file_path}")
 
-        file_content = self.file_path.read_text(encoding='utf-8')
+        metadata, self.content = _parse_file(
+            os.path.abspath(self.file_path), st.st_mtime_ns, st.st_size
+        )
+        # The cached dict is shared; give each parser its own copy
+        self.metadata = copy.deepcopy(metadata)
+
+        # Derive the common fields once rather than on every getter call
+        self._title = self.metadata.get('title')
+        self._provider = self.metadata.get('provider')
+        tags = self.metadata.get('tags', [])
+        if isinstance(tags, str):
+            # Handle comma-separated tags
+            tags = [tag.strip() for tag in tags.split(',')]
+        self._tags = tags
 
-        # Check for YAML front matter
-        front_matter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-        match = re.match(front_matter_pattern, file_content, re.DOTALL)
+        # Validated once; get_schedule() raises for an invalid value
+        self._schedule, self._schedule_error = self._resolve_schedule()
 
-        if match:
-            # Extract front matter and content
-            front_matter_text = match.group(1)
-            self.content = match.group(2).strip()
+    def _resolve_schedule(self) -> Tuple[Optional[str], Optional[str]]:
+        """Normalize and validate the schedule from metadata.
 
-            # Parse YAML front matter
+        Returns:
+            Tuple of (ISO schedule or None, error message or None)
+        """
+        schedule = self.metadata.get('schedule')
+
+        if isinstance(schedule, datetime):
+            return schedule.isoformat(), None
+
+        if isinstance(schedule, str):
+            # Validate ISO format
             try:
-                self.metadata = yaml.safe_load(front_matter_text) or {}
-            except yaml.YAMLError as e:
-                raise ValueError(f"Invalid YAML front matter: {e}")
-        else:
-            # No front matter, entire file is content
-            self.content = file_content.strip()
+                datetime.fromisoformat(schedule)
+                return schedule, None
+            except ValueError:
+                return None, (
+                    f"Invalid schedule format: {schedule}. Use ISO format (YYYY-MM-DDTHH:MM:SS)"
+                )
+
+        return None, None
 
     def get_title(self) -> Optional[str]:
         """Get post title from metadata.
@@ -56,7 +132,7 @@ class PostParser:
         Returns:
             Title if present in metadata, None otherwise
         """
-        return self.metadata.get('title')
+        return self._title
 
     def get_tags(self) -> list:
         """Get tags from metadata.
@@ -64,11 +140,7 @@ class PostParser:
         Returns:
             List of tags, or empty list if none
         """
-        tags = self.metadata.get('tags', [])
-        if isinstance(tags, str):
-            # Handle comma-separated tags
-            return [tag.strip() for tag in tags.split(',')]
-        return tags
+        return self._tags
 
     def get_provider(self) -> Optional[str]:
         """Get target provider from metadata.
@@ -76,30 +148,20 @@ class PostParser:
         Returns:
             Provider name if specified, None otherwise
         """
-        return self.metadata.get('provider')
+        return self._provider
 
     def get_schedule(self) -> Optional[str]:
         """Get schedule time from metadata.
 
         Returns:
             ISO format datetime string if schedule specified, None otherwise
-        """
-        schedule = self.metadata.get('schedule')
-        if schedule is None:
-            return None
 
-        if isinstance(schedule, datetime):
-            return schedule.isoformat()
-
-        if isinstance(schedule, str):
-            # Validate ISO format
-            try:
-                datetime.fromisoformat(schedule)
-                return schedule
-            except ValueError:
-                raise ValueError(f"Invalid schedule format: {schedule}. Use ISO format (YYYY-MM-DDTHH:MM:SS)")
-
-        return None
+        Raises:
+            ValueError: If the schedule is not a valid ISO datetime
+        """
+        if self._schedule_error:
+            raise ValueError(self._schedule_error)
+        return self._schedule
 
     def get_content(self) -> str:
         """Get post content.
@@ -116,11 +178,11 @@ class PostParser:
             Dict containing all parsed data
         """
         return {
-            'title': self.get_title(),
-            'tags': self.get_tags(),
-            'provider': self.get_provider(),
+            'title': self._title,
+            'tags': self._tags,
+            'provider': self._provider,
             'schedule': self.get_schedule(),
-            'content': self.get_content(),
+            'content': self.content,
             'metadata': self.metadata
         }
 
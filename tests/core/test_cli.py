@@ -6,22 +6,44 @@ from unittest.mock import patch, Mock
 from socialcli.core.cli import cli
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
-    """Create a CLI test runner."""
+    """Create a CLI test runner shared by the module; invoke() keeps no state."""
     return CliRunner()
 
 
+@pytest.fixture(scope="module")
+def help_results(runner):
+    """Render each command's --help once; keyed by command ('' for the group)."""
+    return {
+        command: runner.invoke(cli, [command, '--help'] if command else ['--help'])
+        for command in ['', 'login', 'post', 'comment', 'queue', 'prune']
+    }
+
+
 class TestCLIFramework:
     """Test CLI framework structure and main command group."""
 
-    def test_cli_main_command_exists(self, runner):
+    def test_cli_main_command_exists(self, help_results):
         """Test that main CLI command group exists."""
-        result = runner.invoke(cli, ['--help'])
+        result = help_results['']
         assert result.exit_code == 0
         assert 'SocialCLI' in result.output
         assert 'Manage social media posts from the command line' in result.output
 
+    @pytest.mark.parametrize("command, description", [
+        ('login', 'Authenticate with a social provider'),
+        ('post', 'Create and publish a post'),
+        ('comment', 'Add a comment to a post'),
+        ('queue', 'Manage scheduled posts'),
+        ('prune', 'Remove published posts'),
+    ])
+    def test_command_exists(self, help_results, command, description):
+        """Test that each subcommand is registered with its help text."""
+        result = help_results[command]
+        assert result.exit_code == 0
+        assert description in result.output
+
     def test_cli_shows_version(self, runner):
         """Test that --version flag displays version info."""
         result = runner.invoke(cli, ['--version'])
@@ -29,9 +51,9 @@ class TestCLIFramework:
         assert 'version' in result.output.lower()
         assert '0.1.0' in result.output
 
-    def test_cli_shows_available_commands(self, runner):
+    def test_cli_shows_available_commands(self, help_results):
         """Test that help text shows all available subcommands."""
-        result = runner.invoke(cli, ['--help'])
+        result = help_results['']
         assert result.exit_code == 0
 
         # Check all expected commands are listed
@@ -51,12 +73,6 @@ class TestCLIFramework:
 class TestLoginCommand:
     """Test login command."""
 
-    def test_login_command_exists(self, runner):
-        """Test that login command is registered."""
-        result = runner.invoke(cli, ['login', '--help'])
-        assert result.exit_code == 0
-        assert 'Authenticate with a social provider' in result.output
-
     def test_login_default_provider(self, runner, mock_home, mock_linkedin_auth, mock_linkedin_provider):
         """Test login with default provider (linkedin)."""
         with patch('socialcli.core.cli.LinkedInAuth', return_value=mock_linkedin_auth):
@@ -72,9 +88,9 @@ class TestLoginCommand:
         assert result.exit_code != 0
         assert 'not yet implemented' in result.output.lower() or 'not configured' in result.output.lower()
 
-    def test_login_help_shows_provider_option(self, runner):
+    def test_login_help_shows_provider_option(self, help_results):
         """Test that login help shows provider option."""
-        result = runner.invoke(cli, ['login', '--help'])
+        result = help_results['login']
         assert result.exit_code == 0
         assert '--provider' in result.output
 
@@ -82,12 +98,6 @@ class TestLoginCommand:
 class TestPostCommand:
     """Test post command."""
 
-    def test_post_command_exists(self, runner):
-        """Test that post command is registered."""
-        result = runner.invoke(cli, ['post', '--help'])
-        assert result.exit_code == 0
-        assert 'Create and publish a post' in result.output
-
     def test_post_requires_file(self, runner):
         """Test that post command requires --file option."""
         result = runner.invoke(cli, ['post'])
@@ -109,9 +119,9 @@ class TestPostCommand:
         assert result.exit_code != 0
         assert 'not configured' in result.output.lower() or 'not yet implemented' in result.output.lower() or 'not authenticated' in result.output.lower()
 
-    def test_post_help_shows_options(self, runner):
+    def test_post_help_shows_options(self, help_results):
         """Test that post help shows file and provider options."""
-        result = runner.invoke(cli, ['post', '--help'])
+        result = help_results['post']
         assert result.exit_code == 0
         assert '--file' in result.output
         assert '--provider' in result.output
@@ -120,12 +130,6 @@ class TestPostCommand:
 class TestCommentCommand:
     """Test comment command."""
 
-    def test_comment_command_exists(self, runner):
-        """Test that comment command is registered."""
-        result = runner.invoke(cli, ['comment', '--help'])
-        assert result.exit_code == 0
-        assert 'Add a comment to a post' in result.output
-
     def test_comment_requires_provider(self, runner):
         """Test that comment command requires provider."""
         result = runner.invoke(cli, ['comment'])
@@ -158,12 +162,6 @@ class TestCommentCommand:
 class TestQueueCommand:
     """Test queue command."""
 
-    def test_queue_command_exists(self, runner):
-        """Test that queue command is registered."""
-        result = runner.invoke(cli, ['queue', '--help'])
-        assert result.exit_code == 0
-        assert 'Manage scheduled posts' in result.output
-
     def test_queue_without_options(self, runner):
         """Test queue command without options."""
         result = runner.invoke(cli, ['queue'])
@@ -179,26 +177,13 @@ class TestQueueCommand:
 class TestPruneCommand:
     """Test prune command."""
 
-    def test_prune_command_exists(self, runner):
-        """Test that prune command is registered."""
-        result = runner.invoke(cli, ['prune', '--help'])
-        assert result.exit_code == 0
-        assert 'Remove published posts' in result.output
-
-    def test_prune_help_shows_examples(self, runner):
-        """Test that prune help shows usage examples."""
-        result = runner.invoke(cli, ['prune', '--help'])
+    def test_prune_help_shows_examples_and_options(self, help_results):
+        """Test that prune help shows usage examples and all options."""
+        result = help_results['prune']
         assert result.exit_code == 0
         assert 'Examples:' in result.output
         assert '--before' in result.output
         assert '--after' in result.output
-
-    def test_prune_help_shows_all_options(self, runner):
-        """Test that prune help shows all available options."""
-        result = runner.invoke(cli, ['prune', '--help'])
-        assert result.exit_code == 0
-        assert '--before' in result.output
-        assert '--after' in result.output
         assert '--status' in result.output
         assert '--dry-run' in result.output
 
@@ -209,58 +194,42 @@ class TestPruneCommand:
         # Should show preview message
         assert 'Would prune' in result.output or 'No posts' in result.output
 
-    def test_prune_with_before_date(self, runner):
-        """Test prune command with --before option."""
-        result = runner.invoke(cli, ['prune', '--before', '2025-10-01', '--dry-run'])
-        assert result.exit_code == 0
-
-    def test_prune_with_after_date(self, runner):
-        """Test prune command with --after option."""
-        result = runner.invoke(cli, ['prune', '--after', '2025-09-01', '--dry-run'])
-        assert result.exit_code == 0
-
-    def test_prune_with_date_range(self, runner):
-        """Test prune command with both before and after dates."""
-        result = runner.invoke(cli, [
-            'prune',
-            '--after', '2025-09-01',
-            '--before', '2025-10-01',
-            '--dry-run'
-        ])
-        assert result.exit_code == 0
-
-    def test_prune_invalid_date_format_before(self, runner):
-        """Test prune rejects invalid date format for --before."""
-        result = runner.invoke(cli, ['prune', '--before', 'invalid-date'])
+    @pytest.mark.parametrize("options", [
+        ['--before', '2025-10-01'],
+        ['--after', '2025-09-01'],
+        ['--after', '2025-09-01', '--before', '2025-10-01'],
+        ['--status', 'failed'],
+    ])
+    def test_prune_filter_options(self, runner, options):
+        """Test prune accepts date range and status filters."""
+        result = runner.invoke(cli, ['prune', *options, '--dry-run'])
+        assert result.exit_code == 0
+
+    @pytest.mark.parametrize("options", [
+        ['--before', 'invalid-date'],
+        ['--after', '10/01/2025'],
+    ])
+    def test_prune_invalid_date_format(self, runner, options):
+        """Test prune rejects invalid date formats."""
+        result = runner.invoke(cli, ['prune', *options])
         assert result.exit_code == 0  # Command runs but shows error
         assert 'Error' in result.output or 'Invalid' in result.output
 
-    def test_prune_invalid_date_format_after(self, runner):
-        """Test prune rejects invalid date format for --after."""
-        result = runner.invoke(cli, ['prune', '--after', '10/01/2025'])
-        assert result.exit_code == 0  # Command runs but shows error
-        assert 'Error' in result.output or 'Invalid' in result.output
-
-    def test_prune_custom_status(self, runner):
-        """Test prune command with custom status."""
-        result = runner.invoke(cli, ['prune', '--status', 'failed', '--dry-run'])
-        assert result.exit_code == 0
-
 
 class TestCLIIntegration:
     """Test CLI integration and overall functionality."""
 
-    def test_all_commands_accessible(self, runner):
+    def test_all_commands_accessible(self, help_results):
         """Test that all commands can be invoked without errors."""
         commands = ['login', 'post', 'comment', 'queue', 'prune']
 
         for command in commands:
-            result = runner.invoke(cli, [command, '--help'])
+            result = help_results[command]
             assert result.exit_code == 0, f"Command {command} failed"
 
-    def test_main_group_help_formatting(self, runner):
+    def test_main_group_help_formatting(self, help_results):
         """Test that main help text is properly formatted."""
-        result = runner.invoke(cli, ['--help'])
+        result = help_results['']
         assert result.exit_code == 0
 
         # Check for proper sections
@@ -268,9 +237,9 @@ class TestCLIIntegration:
         assert 'Options:' in result.output
         assert 'Commands:' in result.output
 
-    def test_command_help_formatting(self, runner):
+    def test_command_help_formatting(self, help_results):
         """Test that individual command help is properly formatted."""
-        result = runner.invoke(cli, ['post', '--help'])
+        result = help_results['post']
         assert result.exit_code == 0
 
         # Check for proper sections
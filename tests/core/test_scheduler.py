@@ -1,12 +1,27 @@
 """Tests for scheduler daemon functionality."""
 
 import pytest
+import signal
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 from socialcli.core.scheduler_daemon import SchedulerDaemon
 from socialcli.core.storage import Storage
+from socialcli.providers.base import AuthenticationError
+
+
+# Fixed schedule times for tests that only care whether a post is due
+_PAST_ISO = datetime(2000, 1, 1).isoformat()
+_FUTURE_ISO = datetime(2999, 1, 1).isoformat()
+
+
+@pytest.fixture(autouse=True)
+def no_signal_handlers(monkeypatch):
+    """Keep SchedulerDaemon from replacing the test process's signal handlers."""
+    monkeypatch.setattr(signal, 'signal', Mock())
 
 
 @pytest.fixture
@@ -21,6 +36,14 @@ def scheduler(temp_storage):
     return SchedulerDaemon(storage=temp_storage, check_interval=1)
 
 
+@pytest.fixture
+def mock_provider(scheduler, monkeypatch):
+    """Provider mock the scheduler returns for any provider name."""
+    provider = MagicMock()
+    monkeypatch.setattr(scheduler, '_get_provider', lambda provider_name: provider)
+    return provider
+
+
 @pytest.fixture
 def sample_post_file(tmp_path):
     """Create a sample post file for testing."""
@@ -58,9 +81,96 @@ class TestProviderInitialization:
 
     def test_get_linkedin_provider(self, scheduler):
         """Test that LinkedIn provider can be initialized."""
-        with patch('socialcli.providers.linkedin.provider.LinkedInProvider') as mock_provider:
-            provider = scheduler._get_provider('linkedin')
-            mock_provider.assert_called_once()
+        provider_config = Mock(client_id='id', client_secret='secret')
+        with patch.object(scheduler.config, 'get_provider_config', return_value=provider_config):
+            with patch('socialcli.providers.linkedin.provider.LinkedInProvider') as mock_provider:
+                provider = scheduler._get_provider('LinkedIn')
+
+        assert provider is mock_provider.return_value
+        mock_provider.assert_called_once_with(
+            client_id='id', client_secret='secret', config=scheduler.config
+        )
+
+    def test_get_provider_reuses_instance(self, scheduler):
+        """Test the provider is built once and reused across calls."""
+        provider_config = Mock(client_id='id', client_secret='secret')
+        with patch.object(scheduler.config, 'get_provider_config', return_value=provider_config):
+            with patch('socialcli.providers.linkedin.provider.LinkedInProvider') as mock_provider:
+                first = scheduler._get_provider('linkedin')
+                second = scheduler._get_provider('LinkedIn')
+
+        assert first is second
+        mock_provider.assert_called_once()
+
+    def test_cached_provider_gets_valid_token(self, scheduler):
+        """Test reusing a provider revalidates (and so refreshes) its access token."""
+        cached = MagicMock()
+        cached.auth.get_valid_token.return_value = 'refreshed-token'
+        scheduler._provider_cache['linkedin'] = cached
+
+        assert scheduler._get_provider('linkedin') is cached
+        cached.auth.get_valid_token.assert_called_once()
+        assert cached.client.access_token == 'refreshed-token'
+
+    def test_auth_error_drops_cached_provider(self, scheduler, sample_post_file):
+        """Test an authentication failure makes the next post rebuild the provider."""
+        failing = MagicMock()
+        failing.post.side_effect = AuthenticationError("Token expired")
+        scheduler._provider_cache['linkedin'] = failing
+        post_data = {
+            'id': 1,
+            'provider': 'linkedin',
+            'file_path': str(sample_post_file),
+            'author': '@testuser',
+            'publish_at': _PAST_ISO
+        }
+
+        config = scheduler.config
+        assert scheduler._execute_post(post_data) is False
+
+        # Sibling workers may still use it, so it is only queued for closing
+        assert 'linkedin' not in scheduler._provider_cache
+        failing.close.assert_not_called()
+        assert scheduler.config is config
+
+    def test_evicted_provider_closed_after_workers_finish(self, scheduler, sample_post_file):
+        """Test a provider dropped mid-tick is closed and the config reloaded afterwards."""
+        failing = MagicMock()
+        failing.post.side_effect = AuthenticationError("Token expired")
+        scheduler._provider_cache['linkedin'] = failing
+        for i in range(3):
+            scheduler.storage.create_scheduled_post(
+                provider='linkedin',
+                author='@testuser',
+                file_path=str(sample_post_file),
+                publish_at=_PAST_ISO,
+                status='pending'
+            )
+
+        reloaded = Mock()
+        with patch('socialcli.core.scheduler_daemon.Config.load', return_value=reloaded):
+            with patch.object(scheduler, '_build_provider', return_value=failing):
+                scheduler._process_posts()
+
+        failing.close.assert_called()
+        assert scheduler._evicted_providers == []
+        assert scheduler.config is reloaded
+
+    def test_run_once_closes_providers(self, scheduler):
+        """Test cached providers are closed when a run finishes."""
+        cached = MagicMock()
+        scheduler._provider_cache['linkedin'] = cached
+
+        scheduler.run_once()
+
+        cached.close.assert_called_once()
+        assert scheduler._provider_cache == {}
+
+    def test_get_provider_not_configured(self, scheduler):
+        """Test a supported but unconfigured provider raises error."""
+        with patch.object(scheduler.config, 'get_provider_config', return_value=None):
+            with pytest.raises(ValueError, match="not configured"):
+                scheduler._get_provider('linkedin')
 
     def test_get_unsupported_provider(self, scheduler):
         """Test that unsupported provider raises error."""
@@ -71,22 +181,20 @@ class TestProviderInitialization:
 class TestPostExecution:
     """Test scheduled post execution."""
 
-    def test_execute_post_success(self, scheduler, sample_post_file):
+    def test_execute_post_success(self, scheduler, sample_post_file, mock_provider):
         """Test successful post execution."""
         post_data = {
             'id': 1,
             'provider': 'linkedin',
             'file_path': str(sample_post_file),
             'author': '@testuser',
-            'publish_at': datetime.now().isoformat()
+            'publish_at': _PAST_ISO
         }
 
         # Mock the provider
-        mock_provider = MagicMock()
         mock_provider.post.return_value = {'url': 'https://linkedin.com/post/123', 'id': '123'}
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            result = scheduler._execute_post(post_data)
+        result = scheduler._execute_post(post_data)
 
         assert result is True
         mock_provider.post.assert_called_once()
@@ -98,31 +206,79 @@ class TestPostExecution:
             'provider': 'linkedin',
             'file_path': '/nonexistent/file.md',
             'author': '@testuser',
-            'publish_at': datetime.now().isoformat()
+            'publish_at': _PAST_ISO
         }
 
         result = scheduler._execute_post(post_data)
         assert result is False
 
-    def test_execute_post_provider_error(self, scheduler, sample_post_file):
+    def test_execute_post_provider_error(self, scheduler, sample_post_file, mock_provider):
         """Test post execution handles provider errors."""
         post_data = {
             'id': 1,
             'provider': 'linkedin',
             'file_path': str(sample_post_file),
             'author': '@testuser',
-            'publish_at': datetime.now().isoformat()
+            'publish_at': _PAST_ISO
         }
 
         # Mock provider that raises error
-        mock_provider = MagicMock()
         mock_provider.post.side_effect = Exception("API Error")
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            result = scheduler._execute_post(post_data)
+        result = scheduler._execute_post(post_data)
 
         assert result is False
 
+    def test_execute_post_uploads_media_in_one_batch(self, scheduler, tmp_path, mock_provider):
+        """Test media files are uploaded together and passed to post in order."""
+        post_dir = tmp_path / 'posts'
+        post_dir.mkdir(parents=True, exist_ok=True)
+        (post_dir / 'a.png').write_bytes(b'a')
+        (post_dir / 'b.png').write_bytes(b'b')
+        post_file = post_dir / 'media_post.md'
+        post_file.write_text("""---
+platform: linkedin
+media:
+  - a.png
+  - b.png
+---
+
+Post with images.""", encoding='utf-8')
+
+        mock_provider.upload_media_many.return_value = ['urn:li:image:a', 'urn:li:image:b']
+        mock_provider.post.return_value = {'id': 'urn:li:share:1'}
+
+        post_data = {'id': 1, 'provider': 'linkedin', 'file_path': str(post_file)}
+        assert scheduler._execute_post(post_data) is True
+
+        mock_provider.upload_media_many.assert_called_once_with(
+            [str(post_dir / 'a.png'), str(post_dir / 'b.png')]
+        )
+        post_kwargs = mock_provider.post.call_args[1]
+        assert post_kwargs['media_ids'] == ['urn:li:image:a', 'urn:li:image:b']
+        assert post_kwargs['media_titles'] == ['a.png', 'b.png']
+
+    def test_execute_post_missing_media_uploads_nothing(self, scheduler, tmp_path, mock_provider):
+        """Test a missing media file fails the post before any upload starts."""
+        post_dir = tmp_path / 'posts'
+        post_dir.mkdir(parents=True, exist_ok=True)
+        (post_dir / 'a.png').write_bytes(b'a')
+        post_file = post_dir / 'media_post.md'
+        post_file.write_text("""---
+platform: linkedin
+media:
+  - a.png
+  - missing.png
+---
+
+Post with images.""", encoding='utf-8')
+
+        post_data = {'id': 1, 'provider': 'linkedin', 'file_path': str(post_file)}
+        assert scheduler._execute_post(post_data) is False
+
+        mock_provider.upload_media_many.assert_not_called()
+        mock_provider.post.assert_not_called()
+
 
 class TestPendingPostProcessing:
     """Test processing of pending posts."""
@@ -135,12 +291,11 @@ class TestPendingPostProcessing:
     def test_process_posts_not_yet_due(self, scheduler, sample_post_file):
         """Test that posts not yet due are not processed."""
         # Schedule a post for the future
-        future_time = datetime.now() + timedelta(hours=1)
         scheduler.storage.create_scheduled_post(
             provider='linkedin',
             author='@testuser',
             file_path=str(sample_post_file),
-            publish_at=future_time.isoformat(),
+            publish_at=_FUTURE_ISO,
             status='pending'
         )
 
@@ -149,25 +304,22 @@ class TestPendingPostProcessing:
             scheduler._process_pending_posts()
             mock_execute.assert_not_called()
 
-    def test_process_due_posts(self, scheduler, sample_post_file):
+    def test_process_due_posts(self, scheduler, sample_post_file, mock_provider):
         """Test that due posts are processed."""
         # Schedule a post for the past
-        past_time = datetime.now() - timedelta(hours=1)
         result = scheduler.storage.create_scheduled_post(
             provider='linkedin',
             author='@testuser',
             file_path=str(sample_post_file),
-            publish_at=past_time.isoformat(),
+            publish_at=_PAST_ISO,
             status='pending'
         )
         post_id = result['id']
 
         # Mock successful execution
-        mock_provider = MagicMock()
         mock_provider.post.return_value = {'id': 'urn:li:share:123', 'url': 'https://linkedin.com/post/123'}
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            scheduler._process_pending_posts()
+        scheduler._process_pending_posts()
 
         # Verify post was executed and status updated
         post = scheduler.storage.get_scheduled_post(post_id)
@@ -175,49 +327,43 @@ class TestPendingPostProcessing:
         # Verify URN was stored (Task 19)
         assert post['urn'] == 'urn:li:share:123'
 
-    def test_process_failed_post_updates_status(self, scheduler, sample_post_file):
+    def test_process_failed_post_updates_status(self, scheduler, sample_post_file, mock_provider):
         """Test that failed posts have status updated to 'failed'."""
         # Schedule a post for the past
-        past_time = datetime.now() - timedelta(hours=1)
         result = scheduler.storage.create_scheduled_post(
             provider='linkedin',
             author='@testuser',
             file_path=str(sample_post_file),
-            publish_at=past_time.isoformat(),
+            publish_at=_PAST_ISO,
             status='pending'
         )
         post_id = result['id']
 
         # Mock failed execution
-        mock_provider = MagicMock()
         mock_provider.post.side_effect = Exception("API Error")
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            scheduler._process_pending_posts()
+        scheduler._process_pending_posts()
 
         # Verify status updated to failed
         post = scheduler.storage.get_scheduled_post(post_id)
         assert post['status'] == 'failed'
 
-    def test_process_multiple_due_posts(self, scheduler, sample_post_file):
+    def test_process_multiple_due_posts(self, scheduler, sample_post_file, mock_provider):
         """Test processing multiple due posts."""
         # Create multiple scheduled posts
-        past_time = datetime.now() - timedelta(hours=1)
         for i in range(3):
             scheduler.storage.create_scheduled_post(
                 provider='linkedin',
                 author='@testuser',
                 file_path=str(sample_post_file),
-                publish_at=past_time.isoformat(),
+                publish_at=_PAST_ISO,
                 status='pending'
             )
 
         # Mock successful execution
-        mock_provider = MagicMock()
         mock_provider.post.return_value = {'url': 'https://linkedin.com/post/123'}
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            scheduler._process_pending_posts()
+        scheduler._process_pending_posts()
 
         # Verify all posts were processed
         assert mock_provider.post.call_count == 3
@@ -227,28 +373,85 @@ class TestPendingPostProcessing:
         for post in posts:
             assert post['status'] == 'published'
 
+    def test_concurrent_posts_keep_all_updates(self, scheduler, sample_post_file, mock_provider):
+        """Test posts published in parallel do not overwrite each other's updates."""
+        for i in range(6):
+            scheduler.storage.create_scheduled_post(
+                provider='linkedin',
+                author='@testuser',
+                file_path=str(sample_post_file),
+                publish_at=_PAST_ISO,
+                status='pending'
+            )
+
+        counter = iter(range(100))
+
+        def slow_post(**kwargs):
+            time.sleep(0.02)
+            return {'id': f'urn:li:share:{next(counter)}'}
+
+        mock_provider.post.side_effect = slow_post
+
+        scheduler._process_pending_posts()
+
+        posts = scheduler.storage.get_all_scheduled_posts()
+        assert all(post['status'] == 'published' for post in posts)
+        assert len({post['urn'] for post in posts}) == 6
+
+    @pytest.mark.parametrize("due_count,upload_workers", [(1, 4), (2, 2), (4, 1), (6, 1)])
+    def test_upload_workers_share_thread_budget(
+        self, scheduler, tmp_path, mock_provider, due_count, upload_workers
+    ):
+        """Test concurrent posts split max_workers with their media uploads."""
+        post_dir = tmp_path / 'posts'
+        post_dir.mkdir(parents=True, exist_ok=True)
+        (post_dir / 'a.png').write_bytes(b'a')
+        post_file = post_dir / 'media_post.md'
+        post_file.write_text("""---
+platform: linkedin
+media:
+  - a.png
+---
+
+Post with an image.""", encoding='utf-8')
+        for i in range(due_count):
+            scheduler.storage.create_scheduled_post(
+                provider='linkedin',
+                author='@testuser',
+                file_path=str(post_file),
+                publish_at=_PAST_ISO,
+                status='pending'
+            )
+
+        scheduler.max_workers = 4
+        mock_provider.upload_media_many.return_value = ['urn:li:image:a']
+        mock_provider.post.return_value = {'url': 'https://linkedin.com/post/123'}
+
+        scheduler._process_pending_posts()
+
+        assert mock_provider.upload_media_many.call_count == due_count
+        for call in mock_provider.upload_media_many.call_args_list:
+            assert call[1] == {'max_workers': upload_workers}
+
 
 class TestSchedulerRunOnce:
     """Test single execution of scheduler."""
 
-    def test_run_once(self, scheduler, sample_post_file):
+    def test_run_once(self, scheduler, sample_post_file, mock_provider):
         """Test run_once processes pending posts."""
         # Schedule a post for the past
-        past_time = datetime.now() - timedelta(hours=1)
         scheduler.storage.create_scheduled_post(
             provider='linkedin',
             author='@testuser',
             file_path=str(sample_post_file),
-            publish_at=past_time.isoformat(),
+            publish_at=_PAST_ISO,
             status='pending'
         )
 
         # Mock successful execution
-        mock_provider = MagicMock()
         mock_provider.post.return_value = {'url': 'https://linkedin.com/post/123'}
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            scheduler.run_once()
+        scheduler.run_once()
 
         # Verify post was processed
         posts = scheduler.storage.get_all_scheduled_posts()
@@ -271,6 +474,63 @@ class TestSchedulerDaemon:
             # Should have been set to True initially
             assert mock_sleep.called
 
+    def test_wait_shortened_for_upcoming_post(self, scheduler, sample_post_file):
+        """Test the loop wakes when the next post is due, not a full interval later."""
+        scheduler.check_interval = 300
+        scheduler.storage.create_scheduled_post(
+            provider='linkedin',
+            author='@testuser',
+            file_path=str(sample_post_file),
+            publish_at=(datetime.now() + timedelta(seconds=5)).isoformat(),
+            status='pending'
+        )
+        scheduler._process_pending_posts()
+
+        timeout = scheduler._next_wait_timeout()
+        assert 0 < timeout <= 5
+
+    def test_wait_capped_at_check_interval(self, scheduler, sample_post_file):
+        """Test posts due far in the future do not stretch the wait."""
+        scheduler.storage.create_scheduled_post(
+            provider='linkedin',
+            author='@testuser',
+            file_path=str(sample_post_file),
+            publish_at=_FUTURE_ISO,
+            status='pending'
+        )
+        scheduler._process_pending_posts()
+
+        assert scheduler._next_wait_timeout() == scheduler.check_interval
+
+    def test_wait_resets_when_storage_read_fails(self, scheduler):
+        """Test a failed read does not keep an old, passed deadline."""
+        scheduler._next_due_at = time.time() - 10
+
+        with patch.object(
+            scheduler.storage, 'get_all_scheduled_posts', side_effect=OSError("disk error")
+        ):
+            scheduler._process_posts()
+
+        assert scheduler._next_wait_timeout() == scheduler.check_interval
+
+    def test_signal_handler_interrupts_wait(self, temp_storage):
+        """Test a stop request ends run() without waiting out the interval."""
+        scheduler = SchedulerDaemon(storage=temp_storage, check_interval=60)
+        thread = threading.Thread(target=scheduler.run)
+        thread.start()
+        while not scheduler.running:
+            time.sleep(0.01)
+
+        scheduler._signal_handler(signal.SIGTERM, None)
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+
+    def test_init_registers_signal_handlers(self, scheduler):
+        """Test SIGINT and SIGTERM are routed to the shutdown handler."""
+        signal.signal.assert_any_call(signal.SIGINT, scheduler._signal_handler)
+        signal.signal.assert_any_call(signal.SIGTERM, scheduler._signal_handler)
+
     def test_signal_handler_stops_daemon(self, scheduler):
         """Test that signal handler stops the daemon."""
         scheduler.running = True
@@ -295,7 +555,7 @@ visibility: public
 This is a test comment for scheduler.""", encoding='utf-8')
         return comment_file
 
-    def test_comment_deferred_when_parent_pending(self, scheduler, sample_post_file, sample_comment_file):
+    def test_comment_deferred_when_parent_pending(self, scheduler, sample_post_file, sample_comment_file, mock_provider):
         """Test that comments are deferred when parent post is pending."""
         # Create parent post scheduled for the past (but still pending - hasn't been processed yet)
         parent_time = datetime.now() - timedelta(hours=1)
@@ -324,17 +584,15 @@ This is a test comment for scheduler.""", encoding='utf-8')
         comment_id = comment_result['id']
 
         # Mock provider to prevent actual posting (which would change parent status)
-        mock_provider = MagicMock()
         mock_provider.post.return_value = {'url': 'https://linkedin.com/post/123'}
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            # Process posts - parent will be "published" but we'll manually keep it pending
-            scheduler._process_posts()
-            # Manually set parent back to pending (simulating a scenario where post didn't execute)
-            scheduler.storage.update_scheduled_post(parent_result['id'], status='pending')
+        # Process posts - parent will be "published" but we'll manually keep it pending
+        scheduler._process_posts()
+        # Manually set parent back to pending (simulating a scenario where post didn't execute)
+        scheduler.storage.update_scheduled_post(parent_result['id'], status='pending')
 
-            # Now process comments
-            scheduler._process_comments()
+        # Now process comments
+        scheduler._process_comments()
 
         # Verify comment remains pending (deferred) because parent is still pending
         comment = scheduler.storage.get_scheduled_post(comment_id)
@@ -448,7 +706,7 @@ This is a test comment for scheduler.""", encoding='utf-8')
         assert comment['status'] == 'failed'
         assert 'failed to publish' in comment.get('blocked_reason', '').lower()
 
-    def test_multiple_comments_processed_independently(self, scheduler, sample_post_file, sample_comment_file):
+    def test_multiple_comments_processed_independently(self, scheduler, sample_post_file, sample_comment_file, mock_provider):
         """Test that multiple comments are processed independently based on parent status."""
         # Create first parent post - published (already completed)
         parent1_time = datetime.now() - timedelta(hours=2)
@@ -499,18 +757,16 @@ This is a test comment for scheduler.""", encoding='utf-8')
         )
 
         # Mock provider for both post and comment methods
-        mock_provider = MagicMock()
         mock_provider.post.return_value = {'id': 'urn:li:share:999', 'url': 'https://linkedin.com/post/123'}
         mock_provider.comment.return_value = {'id': 'urn:li:comment:888'}
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            # Process posts
-            scheduler._process_posts()
-            # Manually set parent2 back to pending (simulating it wasn't processed)
-            scheduler.storage.update_scheduled_post(parent2_result['id'], status='pending')
+        # Process posts
+        scheduler._process_posts()
+        # Manually set parent2 back to pending (simulating it wasn't processed)
+        scheduler.storage.update_scheduled_post(parent2_result['id'], status='pending')
 
-            # Now process comments
-            scheduler._process_comments()
+        # Now process comments
+        scheduler._process_comments()
 
         # Verify comment 1 was posted successfully (parent published with URN)
         comment1 = scheduler.storage.get_scheduled_post(comment1_result['id'])
@@ -537,15 +793,14 @@ visibility: public
 This is a test comment.""", encoding='utf-8')
         return comment_file
 
-    def test_execute_post_stores_urn(self, scheduler, sample_post_file):
+    def test_execute_post_stores_urn(self, scheduler, sample_post_file, mock_provider):
         """Test that _execute_post stores URN after successful posting."""
         # Create a scheduled post
-        past_time = datetime.now() - timedelta(hours=1)
         post_result = scheduler.storage.create_scheduled_post(
             provider='linkedin',
             author='@testuser',
             file_path=str(sample_post_file),
-            publish_at=past_time.isoformat(),
+            publish_at=_PAST_ISO,
             status='pending',
             post_type='post'
         )
@@ -557,16 +812,14 @@ This is a test comment.""", encoding='utf-8')
             'provider': 'linkedin',
             'file_path': str(sample_post_file),
             'author': '@testuser',
-            'publish_at': past_time.isoformat()
+            'publish_at': _PAST_ISO
         }
 
         # Mock provider with URN in response
-        mock_provider = MagicMock()
         test_urn = 'urn:li:share:987654321'
         mock_provider.post.return_value = {'id': test_urn, 'url': 'https://linkedin.com/post/123'}
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            result = scheduler._execute_post(post_data)
+        result = scheduler._execute_post(post_data)
 
         # Verify success
         assert result is True
@@ -575,7 +828,7 @@ This is a test comment.""", encoding='utf-8')
         post = scheduler.storage.get_scheduled_post(post_id)
         assert post['urn'] == test_urn
 
-    def test_execute_comment_success(self, scheduler, sample_post_file, sample_comment_file):
+    def test_execute_comment_success(self, scheduler, sample_post_file, sample_comment_file, mock_provider):
         """Test successful comment posting with URN resolution."""
         # Create parent post with URN
         past_time = datetime.now() - timedelta(hours=2)
@@ -606,12 +859,10 @@ This is a test comment.""", encoding='utf-8')
         comment_data = scheduler.storage.get_scheduled_post(comment_result['id'])
 
         # Mock provider comment response
-        mock_provider = MagicMock()
         test_comment_urn = 'urn:li:comment:comment123'
         mock_provider.comment.return_value = {'id': test_comment_urn}
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            result = scheduler._execute_comment(comment_data, parent_data)
+        result = scheduler._execute_comment(comment_data, parent_data)
 
         # Verify success
         assert result is True
@@ -696,7 +947,7 @@ This is a test comment.""", encoding='utf-8')
         # Verify failure
         assert result is False
 
-    def test_execute_comment_fails_when_provider_raises_error(self, scheduler, sample_comment_file):
+    def test_execute_comment_fails_when_provider_raises_error(self, scheduler, sample_comment_file, mock_provider):
         """Test comment posting fails gracefully when provider raises an error."""
         # Create parent post with URN
         past_time = datetime.now() - timedelta(hours=2)
@@ -727,11 +978,9 @@ This is a test comment.""", encoding='utf-8')
         comment_data = scheduler.storage.get_scheduled_post(comment_result['id'])
 
         # Mock provider to raise error
-        mock_provider = MagicMock()
         mock_provider.comment.side_effect = Exception("API Error")
 
-        with patch.object(scheduler, '_get_provider', return_value=mock_provider):
-            result = scheduler._execute_comment(comment_data, parent_data)
+        result = scheduler._execute_comment(comment_data, parent_data)
 
         # Verify failure
         assert result is False
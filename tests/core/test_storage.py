@@ -154,6 +154,41 @@ class TestScheduledPostCRUD:
         assert post['status'] == "published"
         assert 'updated_at' in post
 
+    def test_publish_at_epoch_derived_not_saved(self, temp_storage):
+        """Test the publish timestamp is derived on read and kept out of the file."""
+        result = temp_storage.create_scheduled_post(
+            provider="linkedin",
+            author="@testuser",
+            file_path="/path/to/post.md",
+            publish_at="2025-10-21T09:00:00"
+        )
+
+        post = temp_storage.get_scheduled_post(result['id'])
+        assert post['publish_at_epoch'] == datetime(2025, 10, 21, 9, 0).timestamp()
+
+        with open(temp_storage.scheduled_posts_file, 'r') as f:
+            saved = json.load(f)
+        assert 'publish_at_epoch' not in saved['posts'][0]
+
+    def test_publish_at_epoch_follows_hand_edited_file(self, storage_with_posts):
+        """Test that editing publish_at in the JSON file moves the timestamp too."""
+        with open(storage_with_posts.scheduled_posts_file, 'r') as f:
+            data = json.load(f)
+        data['posts'][0]['publish_at'] = "2026-01-05T10:00:00"
+        data['posts'][0]['publish_at_epoch'] = 0.0  # stale value from an older file
+        with open(storage_with_posts.scheduled_posts_file, 'w') as f:
+            json.dump(data, f)
+
+        post = storage_with_posts.get_scheduled_post(1)
+        assert post['publish_at_epoch'] == datetime(2026, 1, 5, 10, 0).timestamp()
+
+    def test_update_scheduled_post_refreshes_publish_at_epoch(self, storage_with_posts):
+        """Test that rescheduling a post recomputes its timestamp."""
+        storage_with_posts.update_scheduled_post(1, publish_at="2025-12-01T08:00:00")
+
+        post = storage_with_posts.get_scheduled_post(1)
+        assert post['publish_at_epoch'] == datetime(2025, 12, 1, 8, 0).timestamp()
+
     def test_update_scheduled_post_not_found(self, temp_storage):
         """Test updating a non-existent post returns False."""
         success = temp_storage.update_scheduled_post(999, status="published")
@@ -442,6 +477,7 @@ class TestLazyMigration:
         assert post['parent_uuid'] is None
         assert 'blocked_reason' in post
         assert post['blocked_reason'] is None
+        assert post['publish_at_epoch'] == datetime(2025, 10, 21, 9, 0).timestamp()
 
     def test_lazy_migration_preserves_existing_data(self, temp_storage):
         """Test that migration preserves original post data."""
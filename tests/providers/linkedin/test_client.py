@@ -6,8 +6,14 @@ from unittest.mock import Mock, patch, MagicMock
 import requests
 from requests.exceptions import RetryError, RequestException
 
-from socialcli.providers.linkedin.client import LinkedInAPIClient, RateLimiter
+from socialcli.providers.linkedin.client import (
+    LinkedInAPIClient,
+    RateLimiter,
+    MAX_BULK_WORKERS,
+    POOL_CONNECTIONS,
+)
 from socialcli.providers.base import AuthenticationError
+from socialcli.utils import jsoncodec
 
 
 class TestRateLimiter:
@@ -67,6 +73,29 @@ class TestRateLimiter:
 
         assert duration < 0.2  # Should be nearly instant
 
+    def test_rate_limiter_defer_holds_requests(self):
+        """Test a deferred limiter blocks until the delay has passed."""
+        limiter = RateLimiter(max_requests=10, time_window=60)
+        limiter.defer(0.3)
+
+        start = time.time()
+        limiter.wait_if_needed()
+        duration = time.time() - start
+
+        assert duration >= 0.25
+        assert duration < 0.8
+
+    def test_rate_limiter_defer_keeps_longest_delay(self):
+        """Test a shorter defer does not cut an existing one short."""
+        limiter = RateLimiter(max_requests=10, time_window=60)
+        limiter.defer(0.3)
+        limiter.defer(0.0)
+
+        start = time.time()
+        limiter.wait_if_needed()
+
+        assert time.time() - start >= 0.25
+
 
 class TestLinkedInAPIClient:
     """Test LinkedIn API client."""
@@ -94,6 +123,32 @@ class TestLinkedInAPIClient:
         assert client.rate_limiter.time_window == 60
         assert isinstance(client.session, requests.Session)
 
+    def test_client_uses_injected_session(self):
+        """Test a caller-provided session is used but not reconfigured or closed."""
+        session = requests.Session()
+        adapter = session.get_adapter("https://")
+        client = LinkedInAPIClient(access_token="test_token", session=session)
+
+        assert client.session is session
+        assert session.get_adapter("https://") is adapter
+
+        with patch.object(session, 'close') as mock_close:
+            client.close()
+        mock_close.assert_not_called()
+
+    def test_client_owned_session_pooling(self):
+        """Test the client's own session is pooled for bulk() fan-out and closed."""
+        client = LinkedInAPIClient(access_token="test_token")
+        adapter = client.session.get_adapter("https://")
+
+        assert adapter.max_retries.total == 3
+        assert adapter._pool_connections == POOL_CONNECTIONS
+        assert adapter._pool_maxsize == MAX_BULK_WORKERS
+
+        with patch.object(client.session, 'close') as mock_close:
+            client.close()
+        mock_close.assert_called_once()
+
     def test_client_initialization_custom_rate_limit(self):
         """Test client initialization with custom rate limit."""
         client = LinkedInAPIClient(
@@ -127,6 +182,14 @@ class TestLinkedInAPIClient:
         assert headers['Authorization'] == 'Bearer test_token_123'
         assert headers['Custom-Header'] == 'value'
 
+    def test_get_headers_do_not_leak_between_calls(self, client):
+        """Test additional headers never end up in the shared template."""
+        client._get_headers({'Content-Type': 'application/octet-stream'})
+        headers = client._get_headers()
+
+        assert headers['Content-Type'] == 'application/json'
+        assert 'Authorization' not in LinkedInAPIClient._BASE_HEADERS
+
     def test_handle_error_response_401(self, client):
         """Test 401 raises AuthenticationError."""
         response = Mock(spec=requests.Response)
@@ -192,7 +255,8 @@ class TestLinkedInAPIClient:
             assert response.ok
             client.session.request.assert_called_once()
             call_kwargs = client.session.request.call_args[1]
-            assert call_kwargs['json'] == post_data
+            assert call_kwargs['json'] is None
+            assert jsoncodec.loads(call_kwargs['data']) == post_data
 
     def test_request_uses_rate_limiter(self, client, mock_response):
         """Test request applies rate limiting."""
@@ -218,12 +282,51 @@ class TestLinkedInAPIClient:
             call_args = mock_req.call_args
             assert call_args[1]['url'].startswith(client.API_BASE)
 
+    def test_request_url_with_and_without_leading_slash(self, client, mock_response):
+        """Test endpoints build the same URL with or without a leading slash."""
+        with patch.object(client.session, 'request', return_value=mock_response) as mock_req:
+            client.request("GET", "/userinfo")
+            client.request("GET", "userinfo")
+
+            urls = [call[1]['url'] for call in mock_req.call_args_list]
+            assert urls == ["https://api.linkedin.com/v2/userinfo"] * 2
+
     def test_request_handles_retry_error(self, client):
         """Test request handles retry exhaustion."""
         with patch.object(client.session, 'request', side_effect=RetryError("Max retries")):
             with pytest.raises(requests.HTTPError, match="failed after maximum retries"):
                 client.request("GET", "/me")
 
+    def test_request_throttled_defers_rate_limiter(self, client):
+        """Test Retry-After on a throttled response pauses later requests."""
+        response = Mock(spec=requests.Response)
+        response.ok = False
+        response.status_code = 429
+        response.headers = {'Retry-After': '30'}
+        response.json.return_value = {"message": "Too many requests"}
+
+        with patch.object(client.session, 'request', return_value=response):
+            with patch.object(client.rate_limiter, 'defer') as mock_defer:
+                with pytest.raises(requests.HTTPError, match="429"):
+                    client.request("POST", "/posts")
+
+        mock_defer.assert_called_once_with(30)
+
+    def test_request_ignores_invalid_retry_after(self, client):
+        """Test a malformed Retry-After header is ignored."""
+        response = Mock(spec=requests.Response)
+        response.ok = False
+        response.status_code = 503
+        response.headers = {'Retry-After': 'soon'}
+        response.json.return_value = {"message": "Unavailable"}
+
+        with patch.object(client.session, 'request', return_value=response):
+            with patch.object(client.rate_limiter, 'defer') as mock_defer:
+                with pytest.raises(requests.HTTPError, match="503"):
+                    client.request("GET", "/me")
+
+        mock_defer.assert_not_called()
+
     def test_request_handles_request_exception(self, client):
         """Test request handles general request exceptions."""
         with patch.object(client.session, 'request', side_effect=RequestException("Network error")):
@@ -262,11 +365,38 @@ class TestLinkedInAPIClient:
             mock_request.assert_called_once_with("DELETE", "/resource/123")
             assert response == mock_response
 
+    def test_bulk_returns_responses_in_order(self, client):
+        """Test bulk runs every request and preserves input order."""
+        def fake_request(method, endpoint, **kwargs):
+            response = Mock(spec=requests.Response)
+            response.url = endpoint
+            return response
+
+        with patch.object(client, 'request', side_effect=fake_request) as mock_request:
+            responses = client.bulk([
+                {'method': 'GET', 'endpoint': f'posts/{i}'} for i in range(5)
+            ])
+
+        assert [r.url for r in responses] == [f'posts/{i}' for i in range(5)]
+        assert mock_request.call_count == 5
+
+    def test_bulk_empty_list(self, client):
+        """Test bulk with no requests returns an empty list."""
+        assert client.bulk([]) == []
+
     def test_set_access_token(self, client):
         """Test updating access token."""
         client.set_access_token("new_token_456")
 
         assert client.access_token == "new_token_456"
+        assert client.auth_header == "Bearer new_token_456"
+        assert client._get_headers()['Authorization'] == "Bearer new_token_456"
+
+    def test_auth_header_cleared_without_token(self, client):
+        """Test clearing the token clears the cached Authorization value."""
+        client.access_token = None
+
+        assert client.auth_header is None
 
     def test_close_session(self, client):
         """Test closing HTTP session."""
@@ -292,3 +422,42 @@ class TestLinkedInAPIClient:
         assert 429 in adapter.max_retries.status_forcelist
         assert 500 in adapter.max_retries.status_forcelist
         assert 503 in adapter.max_retries.status_forcelist
+
+    def test_retry_strategy_shared_between_clients(self):
+        """Test clients with the same settings reuse one Retry policy."""
+        first = LinkedInAPIClient(access_token="a")
+        second = LinkedInAPIClient(access_token="b")
+
+        first_adapter = first.session.get_adapter("https://")
+        second_adapter = second.session.get_adapter("https://")
+
+        assert first_adapter is not second_adapter
+        assert first_adapter.max_retries is second_adapter.max_retries
+
+    def test_retry_strategy_skips_unsafe_methods_on_server_error(self, client):
+        """Test POST is only retried when throttled, GET also on 5xx."""
+        retry = client.session.get_adapter("https://").max_retries
+
+        assert retry.is_retry("GET", 503)
+        assert retry.is_retry("POST", 429)
+        assert not retry.is_retry("POST", 500)
+        assert not retry.is_retry("PUT", 503)
+
+    def test_retry_backoff_adds_jitter(self, client):
+        """Test exponential backoff gets up to one backoff_factor of jitter."""
+        retry = client.session.get_adapter("https://").max_retries
+        for _ in range(3):
+            retry = retry.increment(method="GET", url="/", error=requests.ConnectionError())
+
+        base = retry.backoff_factor * (2 ** 2)
+        delays = {retry.get_backoff_time() for _ in range(20)}
+
+        assert all(base <= delay <= base + retry.backoff_factor for delay in delays)
+        assert len(delays) > 1
+
+    def test_retry_backoff_first_retry_is_immediate(self, client):
+        """Test jitter does not delay the first retry."""
+        retry = client.session.get_adapter("https://").max_retries
+        retry = retry.increment(method="GET", url="/", error=requests.ConnectionError())
+
+        assert retry.get_backoff_time() == 0
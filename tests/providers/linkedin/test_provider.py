@@ -1,10 +1,32 @@
 """Tests for LinkedIn provider implementation."""
 
+import io
+import os
+import threading
+import time
 import pytest
+from http.server import HTTPServer, BaseHTTPRequestHandler
 from unittest.mock import Mock, patch, MagicMock, PropertyMock
 import requests
-
-from socialcli.providers.linkedin.provider import LinkedInProvider
+from requests.adapters import HTTPAdapter
+
+from socialcli.core.config import Config, ProviderConfig
+from socialcli.providers.linkedin.provider import (
+    LinkedInProvider,
+    _FileChunks,
+    _as_list,
+    _encode_urn,
+    _json_body,
+    _log_response_debug,
+    _media_info,
+    _prefetch_file,
+    _register_upload_payload,
+    _POST_BASE,
+    PROFILE_CACHE_TTL,
+    PROFILE_BATCH_SIZE,
+    UPLOAD_RETRY
+)
+from socialcli.utils import jsoncodec
 from socialcli.providers.base import (
     AuthenticationError,
     PostError,
@@ -40,6 +62,32 @@ class TestLinkedInProviderInitialization:
         assert provider.client.access_token is None
         assert provider.auth is None
 
+    def test_upload_session_reused_and_closed(self):
+        """Test uploads share one lazily created session that close() releases."""
+        provider = LinkedInProvider(access_token="test_token")
+        assert provider._upload_session is None
+
+        session = provider._get_upload_session()
+        assert provider._get_upload_session() is session
+        adapter = session.get_adapter("https://upload.linkedin.com")
+        assert adapter._pool_maxsize == 4
+
+        with patch.object(session, 'close') as mock_upload_close, \
+                patch.object(provider.client, 'close') as mock_client_close:
+            provider.close()
+
+        mock_upload_close.assert_called_once()
+        assert provider._upload_session is None
+        mock_client_close.assert_called_once()
+
+    def test_context_manager_closes_sessions(self):
+        """Test provider works as a context manager and closes on exit."""
+        with patch.object(LinkedInProvider, 'close') as mock_close:
+            with LinkedInProvider(access_token="test_token") as provider:
+                assert isinstance(provider, LinkedInProvider)
+
+        mock_close.assert_called_once()
+
 
 class TestLinkedInProviderLogin:
     """Test login functionality."""
@@ -64,6 +112,17 @@ class TestLinkedInProviderLogin:
         with pytest.raises(AuthenticationError, match="No access token available"):
             provider.login()
 
+    @patch('socialcli.providers.linkedin.provider.LinkedInProvider.get_profile')
+    def test_login_profile_without_id_raises_error(self, mock_get_profile):
+        """Test a profile without a member ID does not yield a bogus URN."""
+        mock_get_profile.return_value = {'name': 'John Doe'}
+
+        provider = LinkedInProvider(access_token="test_token")
+
+        with pytest.raises(AuthenticationError, match="Login failed"):
+            provider.login()
+        assert provider._person_urn is None
+
     @patch('socialcli.providers.linkedin.provider.LinkedInProvider.get_profile')
     def test_login_failure_raises_error(self, mock_get_profile):
         """Test login failure raises AuthenticationError."""
@@ -74,6 +133,47 @@ class TestLinkedInProviderLogin:
         with pytest.raises(AuthenticationError, match="Login failed"):
             provider.login()
 
+    @patch('socialcli.providers.linkedin.provider.LinkedInProvider.get_profile')
+    def test_login_caches_person_urn_in_config(self, mock_get_profile, tmp_path):
+        """Test login persists the person URN for later sessions."""
+        mock_get_profile.return_value = {'id': 'test_user_id'}
+        config = Config(
+            providers={'linkedin': ProviderConfig(
+                client_id='id', client_secret='secret', access_token='test_token'
+            )},
+            config_path=tmp_path / 'config.yaml'
+        )
+
+        LinkedInProvider(client_id='id', client_secret='secret', config=config).login()
+
+        assert config.providers['linkedin'].person_urn == 'urn:li:person:test_user_id'
+
+        # A new provider picks up the cached URN without calling get_profile
+        mock_get_profile.reset_mock()
+        provider = LinkedInProvider(client_id='id', client_secret='secret', config=config)
+        assert provider._person_urn == 'urn:li:person:test_user_id'
+        assert provider._user_id == 'test_user_id'
+        mock_get_profile.assert_not_called()
+
+    @patch('socialcli.providers.linkedin.provider.LinkedInProvider.get_profile')
+    def test_concurrent_callers_login_once(self, mock_get_profile):
+        """Test threads needing the member URN share a single login."""
+        def slow_profile():
+            time.sleep(0.05)
+            return {'id': 'test_user_id'}
+
+        mock_get_profile.side_effect = slow_profile
+        provider = LinkedInProvider(access_token="test_token")
+
+        threads = [threading.Thread(target=provider._ensure_logged_in) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert provider._person_urn == 'urn:li:person:test_user_id'
+        mock_get_profile.assert_called_once()
+
 
 class TestLinkedInProviderPost:
     """Test post creation functionality."""
@@ -85,7 +185,7 @@ class TestLinkedInProviderPost:
         # Setup mock response
         mock_response = Mock()
         mock_response.json.return_value = {'content': 'Test post'}
-        mock_response.text = '{"content": "Test post"}'
+        mock_response.content = b'{"content": "Test post"}'
         mock_response.headers = {'x-restli-id': 'urn:li:share:123456'}
         mock_client_post.return_value = mock_response
 
@@ -111,7 +211,7 @@ class TestLinkedInProviderPost:
         """Test post creation with organization author URN."""
         mock_response = Mock()
         mock_response.json.return_value = {}
-        mock_response.text = '{}'
+        mock_response.content = b'{}'
         mock_response.headers = {'x-restli-id': 'urn:li:share:123456'}
         mock_client_post.return_value = mock_response
 
@@ -126,13 +226,34 @@ class TestLinkedInProviderPost:
         post_data = call_args[1]['json']
         assert post_data['author'] == org_urn
 
+    @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
+    def test_post_payload_leaves_shared_template_untouched(self, mock_client_post, mock_login):
+        """Test per-post fields are not written into the shared payload base."""
+        mock_response = Mock()
+        mock_response.content = b''
+        mock_response.headers = {}
+        mock_client_post.return_value = mock_response
+
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        provider.post("Hidden", visibility='CONNECTIONS', media_ids=['urn:li:image:1'])
+
+        post_data = mock_client_post.call_args[1]['json']
+        assert post_data['visibility'] == 'CONNECTIONS'
+        assert post_data['lifecycleState'] == 'PUBLISHED'
+        assert post_data['distribution']['feedDistribution'] == 'MAIN_FEED'
+        assert _POST_BASE['visibility'] == 'PUBLIC'
+        assert 'content' not in _POST_BASE and 'author' not in _POST_BASE
+
     @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
     @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
     def test_post_with_media(self, mock_client_post, mock_login):
         """Test post creation with media."""
         mock_response = Mock()
         mock_response.json.return_value = {}
-        mock_response.text = '{}'
+        mock_response.content = b'{}'
         mock_response.headers = {'x-restli-id': 'urn:li:share:123456'}
         mock_client_post.return_value = mock_response
 
@@ -149,6 +270,50 @@ class TestLinkedInProviderPost:
         assert 'media' in post_data['content']
         assert post_data['content']['media']['id'] == media_ids[0]
 
+    @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
+    def test_post_with_multiple_images_capped_at_twenty(self, mock_client_post, mock_login, caplog):
+        """Test multi-image posts use multiImage and keep at most 20 images."""
+        mock_response = Mock()
+        mock_response.json.return_value = {}
+        mock_response.content = b'{}'
+        mock_response.headers = {}
+        mock_client_post.return_value = mock_response
+
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        media_ids = [f"urn:li:image:{i}" for i in range(25)]
+        with caplog.at_level('WARNING', logger='socialcli.providers.linkedin.provider'):
+            provider.post("Gallery", media_ids=media_ids)
+
+        images = mock_client_post.call_args[1]['json']['content']['multiImage']['images']
+        assert images == [{"id": media_id} for media_id in media_ids[:20]]
+        assert "dropping 5" in caplog.text
+
+    @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
+    def test_post_with_document_uses_title(self, mock_client_post, mock_login):
+        """Test a single document attachment carries its title."""
+        mock_response = Mock()
+        mock_response.json.return_value = {}
+        mock_response.content = b'{}'
+        mock_response.headers = {}
+        mock_client_post.return_value = mock_response
+
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        provider.post("Slides", media_ids="urn:li:document:1", media_titles=["deck.pdf"])
+
+        media = mock_client_post.call_args[1]['json']['content']['media']
+        assert media == {"title": "deck.pdf", "id": "urn:li:document:1"}
+
+        # Missing or empty titles fall back to a generic one
+        provider.post("Slides", media_ids="urn:li:document:1", media_titles=[])
+        media = mock_client_post.call_args[1]['json']['content']['media']
+        assert media["title"] == "Document"
+
     @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
     @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
     def test_post_failure_raises_error(self, mock_client_post, mock_login):
@@ -169,7 +334,7 @@ class TestLinkedInProviderPost:
         with patch.object(provider.client, 'post') as mock_post:
             mock_response = Mock()
             mock_response.json.return_value = {}
-            mock_response.text = '{}'
+            mock_response.content = b'{}'
             mock_response.headers = {}
             mock_post.return_value = mock_response
 
@@ -187,7 +352,7 @@ class TestLinkedInProviderComment:
         """Test successful comment creation."""
         mock_response = Mock()
         mock_response.json.return_value = {'message': {'text': 'Test comment'}}
-        mock_response.text = '{"message": {"text": "Test comment"}}'
+        mock_response.content = b'{"message": {"text": "Test comment"}}'
         mock_response.headers = {'x-restli-id': 'urn:li:comment:123456'}
         mock_client_post.return_value = mock_response
 
@@ -229,7 +394,7 @@ class TestLinkedInProviderRepost:
         """Test successful repost."""
         mock_response = Mock()
         mock_response.json.return_value = {}
-        mock_response.text = '{}'
+        mock_response.content = b'{}'
         mock_response.headers = {'x-restli-id': 'urn:li:share:789'}
         mock_client_post.return_value = mock_response
 
@@ -253,7 +418,7 @@ class TestLinkedInProviderRepost:
         """Test repost without commentary text."""
         mock_response = Mock()
         mock_response.json.return_value = {}
-        mock_response.text = '{}'
+        mock_response.content = b'{}'
         mock_response.headers = {}
         mock_client_post.return_value = mock_response
 
@@ -283,22 +448,18 @@ class TestLinkedInProviderRepost:
 class TestLinkedInProviderUploadMedia:
     """Test media upload functionality."""
 
-    @patch('mimetypes.guess_type')
-    @patch('os.path.exists')
-    @patch('os.path.getsize')
+    @patch('os.stat')
     @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
     @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
     @patch('builtins.open', create=True)
-    @patch('requests.put')
-    def test_upload_image_success(self, mock_put, mock_open, mock_client_post, mock_login, mock_getsize, mock_exists, mock_guess_type):
+    @patch('requests.Session.put')
+    def test_upload_image_success(self, mock_put, mock_open, mock_client_post, mock_login, mock_stat):
         """Test successful image upload."""
-        mock_exists.return_value = True
-        mock_getsize.return_value = 1024 * 100  # 100KB
-        mock_guess_type.return_value = ('image/jpeg', None)
+        mock_stat.return_value = Mock(st_size=1024 * 100)  # 100KB
 
         # Mock register upload response
         mock_register_response = Mock()
-        mock_register_response.json.return_value = {
+        mock_register_response.content = jsoncodec.dumps({
             'value': {
                 'uploadMechanism': {
                     'com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest': {
@@ -307,7 +468,7 @@ class TestLinkedInProviderUploadMedia:
                 },
                 'asset': 'urn:li:digitalmediaAsset:123456'
             }
-        }
+        })
         mock_client_post.return_value = mock_register_response
 
         # Mock file upload response
@@ -336,22 +497,18 @@ class TestLinkedInProviderUploadMedia:
         mock_put.assert_called_once()
         mock_open.assert_called_once_with('/path/to/image.jpg', 'rb')
 
-    @patch('mimetypes.guess_type')
-    @patch('os.path.exists')
-    @patch('os.path.getsize')
+    @patch('os.stat')
     @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
     @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
     @patch('builtins.open', create=True)
-    @patch('requests.put')
-    def test_upload_video_success(self, mock_put, mock_open, mock_client_post, mock_login, mock_getsize, mock_exists, mock_guess_type):
+    @patch('requests.Session.put')
+    def test_upload_video_success(self, mock_put, mock_open, mock_client_post, mock_login, mock_stat):
         """Test successful video upload."""
-        mock_exists.return_value = True
-        mock_getsize.return_value = 1024 * 1024 * 5  # 5MB
-        mock_guess_type.return_value = ('video/mp4', None)
+        mock_stat.return_value = Mock(st_size=1024 * 1024 * 5)  # 5MB
 
         # Mock register upload response
         mock_register_response = Mock()
-        mock_register_response.json.return_value = {
+        mock_register_response.content = jsoncodec.dumps({
             'value': {
                 'uploadMechanism': {
                     'com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest': {
@@ -360,7 +517,7 @@ class TestLinkedInProviderUploadMedia:
                 },
                 'asset': 'urn:li:digitalmediaAsset:video789'
             }
-        }
+        })
         mock_client_post.return_value = mock_register_response
 
         # Mock file upload response
@@ -385,62 +542,56 @@ class TestLinkedInProviderUploadMedia:
         register_data = call_args[1]['json']
         assert register_data['registerUploadRequest']['recipes'][0] == 'urn:li:digitalmediaRecipe:feedshare-video'
 
-    @patch('os.path.exists')
-    def test_detect_media_type_image(self, mock_exists):
+    def test_media_info_image(self):
         """Test media type detection for images."""
-        mock_exists.return_value = True
+        for ext in ('jpg', 'jpeg', 'png', 'gif', 'webp'):
+            assert _media_info(f"/path/to/file.{ext}")[0] == 'image'
 
-        provider = LinkedInProvider(access_token="test_token")
-
-        # Test various image extensions
-        assert provider._detect_media_type("/path/to/file.jpg") == 'image'
-        assert provider._detect_media_type("/path/to/file.jpeg") == 'image'
-        assert provider._detect_media_type("/path/to/file.png") == 'image'
-        assert provider._detect_media_type("/path/to/file.gif") == 'image'
-        assert provider._detect_media_type("/path/to/file.webp") == 'image'
-
-    @patch('os.path.exists')
-    def test_detect_media_type_video(self, mock_exists):
+    def test_media_info_video(self):
         """Test media type detection for videos."""
-        mock_exists.return_value = True
+        for ext in ('mp4', 'mov', 'avi', 'webm'):
+            assert _media_info(f"/path/to/file.{ext}")[0] == 'video'
 
-        provider = LinkedInProvider(access_token="test_token")
+    def test_media_info_unsupported(self):
+        """Test media type detection for unsupported files."""
+        with pytest.raises(UploadError, match="Unsupported file type"):
+            _media_info("/path/to/file.txt")
 
-        # Test various video extensions
-        assert provider._detect_media_type("/path/to/file.mp4") == 'video'
-        assert provider._detect_media_type("/path/to/file.mov") == 'video'
-        assert provider._detect_media_type("/path/to/file.avi") == 'video'
-        assert provider._detect_media_type("/path/to/file.webm") == 'video'
+        with pytest.raises(UploadError, match="Unsupported file type"):
+            _media_info("/path/to/file")
 
-    @patch('mimetypes.guess_type')
-    @patch('os.path.exists')
-    def test_detect_media_type_unsupported(self, mock_exists, mock_guess_type):
-        """Test media type detection for unsupported files."""
-        mock_exists.return_value = True
-        mock_guess_type.return_value = ('text/plain', None)
+    def test_media_info_document(self):
+        """Test media type detection for documents, case-insensitively."""
+        assert _media_info("/path/to/file.pdf")[0] == 'document'
+        assert _media_info("/path/to/FILE.PPTX")[0] == 'document'
 
-        provider = LinkedInProvider(access_token="test_token")
+    def test_register_upload_payload_built_once_per_owner(self):
+        """Test registerUpload bodies are shared per owner and recipe."""
+        recipe = 'urn:li:digitalmediaRecipe:feedshare-image'
 
-        with pytest.raises(UploadError, match="Unsupported media type"):
-            provider._detect_media_type("/path/to/file.txt")
+        first = _register_upload_payload("urn:li:person:a", recipe)
 
-        mock_guess_type.return_value = ('application/pdf', None)
-        with pytest.raises(UploadError, match="Unsupported media type"):
-            provider._detect_media_type("/path/to/file.pdf")
+        assert _register_upload_payload("urn:li:person:a", recipe) is first
+        other = _register_upload_payload("urn:li:person:b", recipe)
+        assert other is not first
+        assert other['registerUploadRequest']['owner'] == "urn:li:person:b"
 
-    def test_detect_media_type_file_not_found(self):
-        """Test media type detection for non-existent file."""
+    @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
+    def test_upload_media_file_not_found(self, mock_login):
+        """Test uploading a missing file raises UploadError."""
         provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
 
         with pytest.raises(UploadError, match="File not found"):
-            provider._detect_media_type("/path/to/nonexistent.jpg")
+            provider.upload_media("/path/to/nonexistent.jpg")
 
-    @patch('os.path.exists')
+    @patch('os.stat')
     @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
     @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
-    def test_upload_media_api_failure_raises_error(self, mock_client_post, mock_login, mock_exists):
-        """Test media upload API failure raises UploadError."""
-        mock_exists.return_value = True
+    @patch('builtins.open', create=True)
+    def test_upload_media_api_failure_raises_error(self, mock_open, mock_client_post, mock_login, mock_stat):
+        """Test media upload API failure raises UploadError and closes the file."""
+        mock_stat.return_value = Mock(st_size=1024)
         mock_client_post.side_effect = Exception("API error")
 
         provider = LinkedInProvider(access_token="test_token")
@@ -449,22 +600,35 @@ class TestLinkedInProviderUploadMedia:
         with pytest.raises(UploadError, match="Failed to upload media"):
             provider.upload_media("/path/to/image.jpg")
 
-    @patch('mimetypes.guess_type')
-    @patch('os.path.exists')
-    @patch('os.path.getsize')
+        mock_open.return_value.close.assert_called_once()
+
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
+    def test_upload_media_unreadable_file_skips_registration(self, mock_client_post, tmp_path):
+        """Test a file that cannot be opened fails before registerUpload."""
+        image = tmp_path / "image.jpg"
+        image.write_bytes(b"jpeg")
+
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        with patch('builtins.open', side_effect=PermissionError("denied")):
+            with pytest.raises(UploadError, match="Cannot read file"):
+                provider.upload_media(str(image))
+
+        mock_client_post.assert_not_called()
+
+    @patch('os.stat')
     @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
     @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
     @patch('builtins.open', create=True)
-    @patch('requests.put')
-    def test_upload_media_http_error(self, mock_put, mock_open, mock_client_post, mock_login, mock_getsize, mock_exists, mock_guess_type):
+    @patch('requests.Session.put')
+    def test_upload_media_http_error(self, mock_put, mock_open, mock_client_post, mock_login, mock_stat):
         """Test media upload HTTP error raises UploadError."""
-        mock_exists.return_value = True
-        mock_getsize.return_value = 1024
-        mock_guess_type.return_value = ('image/jpeg', None)
+        mock_stat.return_value = Mock(st_size=1024)
 
         # Mock successful registration
         mock_register_response = Mock()
-        mock_register_response.json.return_value = {
+        mock_register_response.content = jsoncodec.dumps({
             'value': {
                 'uploadMechanism': {
                     'com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest': {
@@ -473,7 +637,7 @@ class TestLinkedInProviderUploadMedia:
                 },
                 'asset': 'urn:li:digitalmediaAsset:123456'
             }
-        }
+        })
         mock_client_post.return_value = mock_register_response
 
         # Mock file upload failure
@@ -490,6 +654,299 @@ class TestLinkedInProviderUploadMedia:
         with pytest.raises(UploadError, match="Upload failed"):
             provider.upload_media("/path/to/image.jpg")
 
+    @patch('requests.Session.put')
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.post')
+    def test_upload_document_streams_file_in_blocks(self, mock_client_post, mock_put, tmp_path):
+        """Test document uploads stream a sized body instead of the raw file."""
+        document = tmp_path / "deck.pdf"
+        document.write_bytes(b"%PDF" + b"x" * 2048)
+
+        mock_client_post.return_value.content = jsoncodec.dumps({
+            'value': {
+                'uploadUrl': 'https://upload.linkedin.com/doc123',
+                'document': 'urn:li:document:doc123'
+            }
+        })
+        sent = {}
+
+        def fake_put(url, data=None, headers=None):
+            sent['size'] = len(data)
+            sent['body'] = b"".join(data)
+            sent['headers'] = headers
+            return Mock()
+
+        mock_put.side_effect = fake_put
+
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        assert provider.upload_document(str(document)) == 'urn:li:document:doc123'
+        assert sent['size'] == 2052
+        assert sent['body'] == document.read_bytes()
+        assert sent['headers']['Content-Length'] == '2052'
+
+    def test_upload_media_routes_document_with_one_stat(self, tmp_path):
+        """Test documents routed through upload_media are not stat'ed twice."""
+        document = tmp_path / "deck.pdf"
+        document.write_bytes(b"%PDF")
+
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        with patch('os.stat', wraps=os.stat) as mock_stat, \
+                patch.object(provider, '_upload_document', return_value='urn:li:document:1') as mock_upload:
+            assert provider.upload_media(str(document)) == 'urn:li:document:1'
+
+        mock_stat.assert_called_once_with(str(document))
+        mock_upload.assert_called_once_with(str(document), 4)
+
+    def test_upload_document_file_not_found(self):
+        """Test uploading a missing document raises UploadError."""
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        with pytest.raises(UploadError, match="File not found"):
+            provider.upload_document("/path/to/nonexistent.pdf")
+
+    def test_upload_media_many_preserves_order(self):
+        """Test concurrent uploads return URNs in input order."""
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+        paths = [f"/path/to/image{i}.jpg" for i in range(6)]
+
+        with patch.object(
+            provider, 'upload_media', side_effect=lambda p: f"urn:li:image:{p[-5]}"
+        ) as mock_upload:
+            result = provider.upload_media_many(paths)
+
+        assert result == [f"urn:li:image:{i}" for i in range(6)]
+        assert mock_upload.call_count == 6
+
+    @patch('socialcli.providers.linkedin.provider.LinkedInProvider.login')
+    def test_upload_media_many_logs_in_once(self, mock_login):
+        """Test the member URN is resolved before workers start."""
+        provider = LinkedInProvider(access_token="test_token")
+
+        with patch.object(provider, 'upload_media', return_value="urn:li:image:1"):
+            provider.upload_media_many(["/a.jpg", "/b.jpg"])
+
+        mock_login.assert_called_once()
+
+    def test_upload_media_many_propagates_failure(self):
+        """Test a failed upload fails the whole batch."""
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        with patch.object(provider, 'upload_media', side_effect=UploadError("boom")):
+            with pytest.raises(UploadError, match="boom"):
+                provider.upload_media_many(["/a.jpg", "/b.jpg"])
+
+    def test_upload_media_many_empty(self):
+        """Test an empty batch makes no calls."""
+        provider = LinkedInProvider(access_token="test_token")
+
+        assert provider.upload_media_many([]) == []
+
+    def test_post_many_passes_kwargs_in_order(self):
+        """Test each item is posted with its own kwargs, results in order."""
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+        items = [
+            {'content': f"Post {i}", 'visibility': 'CONNECTIONS'} for i in range(5)
+        ]
+
+        with patch.object(
+            provider, 'post', side_effect=lambda content, **kw: {'id': content}
+        ) as mock_post:
+            result = provider.post_many(items)
+
+        assert result == [{'id': f"Post {i}"} for i in range(5)]
+        mock_post.assert_any_call(content="Post 3", visibility='CONNECTIONS')
+
+    def test_post_many_propagates_failure(self):
+        """Test a failed post fails the batch."""
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        with patch.object(provider, 'post', side_effect=PostError("boom")):
+            with pytest.raises(PostError, match="boom"):
+                provider.post_many([{'content': "a"}, {'content': "b"}])
+
+    def test_comment_many(self):
+        """Test comments are sent per (target, text) pair, results in order."""
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+        comments = [("urn:li:share:1", "First"), ("urn:li:share:2", "Second")]
+
+        with patch.object(
+            provider, 'comment', side_effect=lambda target, text: {'id': f"{target}/{text}"}
+        ):
+            result = provider.comment_many(comments)
+
+        assert result == [{'id': "urn:li:share:1/First"}, {'id': "urn:li:share:2/Second"}]
+
+    def test_post_and_comment_many_empty(self):
+        """Test empty batches make no calls."""
+        provider = LinkedInProvider(access_token="test_token")
+
+        assert provider.post_many([]) == []
+        assert provider.comment_many([]) == []
+
+
+class TestFileChunks:
+    """Test the streaming upload body."""
+
+    def test_yields_whole_file_in_blocks(self):
+        """Test file is read in fixed-size blocks and reports its length."""
+        data = b'x' * 10 + b'y' * 5
+        body = _FileChunks(io.BytesIO(data), len(data), chunk_size=4)
+
+        assert len(body) == 15
+        chunks = list(body)
+        assert b''.join(chunks) == data
+        assert [len(c) for c in chunks] == [4, 4, 4, 3]
+
+    def test_prepared_request_uses_content_length(self):
+        """Test requests sends a sized body rather than chunked encoding."""
+        data = b'payload'
+        prepared = requests.Request(
+            'PUT', 'https://upload.example.com', data=_FileChunks(io.BytesIO(data), len(data))
+        ).prepare()
+
+        assert prepared.headers['Content-Length'] == str(len(data))
+        assert 'Transfer-Encoding' not in prepared.headers
+
+    def test_retried_upload_resends_whole_body(self):
+        """Test a throttled upload is retried with the body rewound."""
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_PUT(self):
+                received.append(self.rfile.read(int(self.headers['Content-Length'])))
+                self.send_response(503 if len(received) == 1 else 201)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(max_retries=UPLOAD_RETRY))
+            data = b'x' * 10
+            response = session.put(
+                f"http://127.0.0.1:{server.server_port}/upload",
+                data=_FileChunks(io.BytesIO(data), len(data), chunk_size=4)
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response.status_code == 201
+        assert received == [data, data]
+
+
+class TestResponseDebugLogging:
+    """Test debug logging of API responses."""
+
+    def test_skipped_when_debug_disabled(self, caplog):
+        """Test headers and body are not touched unless DEBUG is enabled."""
+        response = Mock()
+        type(response).text = PropertyMock(side_effect=AssertionError("body decoded"))
+
+        with caplog.at_level('INFO', logger='socialcli.providers.linkedin.provider'):
+            _log_response_debug("Response", response)
+
+        assert caplog.records == []
+
+    def test_logged_when_debug_enabled(self, caplog):
+        """Test headers and body are logged at DEBUG level."""
+        response = Mock()
+        response.headers = {'x-restli-id': 'urn:li:share:1'}
+        response.text = '{}'
+
+        with caplog.at_level('DEBUG', logger='socialcli.providers.linkedin.provider'):
+            _log_response_debug("Response", response)
+
+        assert "Response headers: {'x-restli-id': 'urn:li:share:1'}" in caplog.text
+        assert "Response body: {}" in caplog.text
+
+
+class TestPrefetchFile:
+    """Test the page-cache read-ahead hint for uploads."""
+
+    @pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason="posix_fadvise unavailable")
+    def test_hints_whole_file(self, tmp_path):
+        """Test the whole file is marked WILLNEED."""
+        path = tmp_path / "image.jpg"
+        path.write_bytes(b"data")
+
+        with open(path, 'rb') as f, patch('os.posix_fadvise') as mock_fadvise:
+            _prefetch_file(f)
+
+            mock_fadvise.assert_called_once_with(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+
+    def test_ignores_os_error(self):
+        """Test a file without a usable descriptor is left alone."""
+        f = Mock()
+        f.fileno.side_effect = io.UnsupportedOperation("no fileno")
+
+        _prefetch_file(f)
+
+
+class TestAsList:
+    """Test media ID normalization."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, []),
+        ('', []),
+        ([], []),
+        ('urn:li:image:1', ['urn:li:image:1']),
+        (['urn:li:image:1', 'urn:li:image:2'], ['urn:li:image:1', 'urn:li:image:2']),
+        (('urn:li:image:1', 'urn:li:image:2'), ['urn:li:image:1', 'urn:li:image:2']),
+    ])
+    def test_normalizes(self, value, expected):
+        """Test single values, sequences and empty input."""
+        assert _as_list(value) == expected
+
+
+class TestEncodeUrn:
+    """Test URN path encoding."""
+
+    def test_escapes_colons(self):
+        """Test URNs are fully escaped for use in a path."""
+        assert _encode_urn("urn:li:share:123") == "urn%3Ali%3Ashare%3A123"
+
+    def test_memoized(self):
+        """Test repeated URNs are served from the cache."""
+        _encode_urn.cache_clear()
+        _encode_urn("urn:li:share:1")
+        _encode_urn("urn:li:share:1")
+
+        assert _encode_urn.cache_info().hits == 1
+
+
+class TestJsonBody:
+    """Test response body decoding."""
+
+    def test_decodes_content_without_text(self):
+        """Test the body is decoded from bytes without building response.text."""
+        response = Mock()
+        response.content = b'{"id": "urn:li:share:1"}'
+        type(response).text = PropertyMock(side_effect=AssertionError("text decoded"))
+
+        assert _json_body(response) == {"id": "urn:li:share:1"}
+
+    def test_empty_body_returns_empty_dict(self):
+        """Test an empty body (e.g. 201 Created) returns {}."""
+        response = Mock()
+        response.content = b''
+
+        assert _json_body(response) == {}
+
 
 class TestLinkedInProviderGetProfile:
     """Test get profile functionality."""
@@ -498,13 +955,13 @@ class TestLinkedInProviderGetProfile:
     def test_get_profile_success(self, mock_client_get):
         """Test successful profile retrieval using OpenID Connect userinfo endpoint."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = jsoncodec.dumps({
             'sub': 'test_user_id',
             'name': 'John Doe',
             'given_name': 'John',
             'family_name': 'Doe',
             'email': 'john.doe@example.com'
-        }
+        })
         mock_client_get.return_value = mock_response
 
         provider = LinkedInProvider(access_token="test_token")
@@ -534,3 +991,121 @@ class TestLinkedInProviderGetProfile:
 
         with pytest.raises(AuthenticationError):
             provider.get_profile()
+
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.get')
+    def test_get_profile_cached_within_ttl(self, mock_client_get):
+        """Test repeated profile lookups reuse the cached userinfo."""
+        mock_client_get.return_value.content = b'{"sub": "test_user_id"}'
+
+        provider = LinkedInProvider(access_token="test_token")
+        first = provider.get_profile()
+        first['id'] = 'mutated'
+        second = provider.get_profile()
+
+        assert second['id'] == 'test_user_id'
+        mock_client_get.assert_called_once()
+
+    @patch('socialcli.providers.linkedin.provider.time.monotonic')
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.get')
+    def test_get_profile_refetched_after_ttl(self, mock_client_get, mock_monotonic):
+        """Test the cache expires after PROFILE_CACHE_TTL."""
+        mock_client_get.return_value.content = b'{"sub": "test_user_id"}'
+        mock_monotonic.return_value = 1000.0
+
+        provider = LinkedInProvider(access_token="test_token")
+        provider.get_profile()
+        mock_monotonic.return_value = 1000.0 + PROFILE_CACHE_TTL
+        provider.get_profile()
+
+        assert mock_client_get.call_count == 2
+
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.get')
+    def test_get_profile_cache_keyed_by_token(self, mock_client_get):
+        """Test a new access token bypasses the cached profile."""
+        mock_client_get.return_value.content = b'{"sub": "test_user_id"}'
+
+        provider = LinkedInProvider(access_token="test_token")
+        provider.get_profile()
+        provider.client.set_access_token("other_token")
+        provider.get_profile()
+
+        assert mock_client_get.call_count == 2
+
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.get')
+    def test_get_profile_failure_clears_cache(self, mock_client_get):
+        """Test an authentication failure is not masked by a cached profile."""
+        provider = LinkedInProvider(access_token="test_token")
+        provider._profile_cache = ("other_token", 0.0, {'id': 'stale'})
+        mock_client_get.side_effect = AuthenticationError("expired")
+
+        with pytest.raises(AuthenticationError):
+            provider.get_profile()
+
+        assert provider._profile_cache is None
+
+
+class TestLinkedInProviderGetProfiles:
+    """Test batched profile lookups."""
+
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.get')
+    def test_get_profiles_single_batch(self, mock_client_get):
+        """Test profiles are fetched in one request and keyed by URN."""
+        mock_client_get.return_value.content = jsoncodec.dumps({
+            'results': {
+                '(id:abc)': {'localizedFirstName': 'Ada'},
+                '(id:def)': {'localizedFirstName': 'Bob'}
+            }
+        })
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        result = provider.get_profiles(
+            ["urn:li:person:abc", "urn:li:person:def", "urn:li:person:abc"]
+        )
+
+        assert result == {
+            "urn:li:person:abc": {'localizedFirstName': 'Ada'},
+            "urn:li:person:def": {'localizedFirstName': 'Bob'}
+        }
+        mock_client_get.assert_called_once_with(
+            "people?ids=List((id:abc),(id:def))", use_rest_api=True
+        )
+
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.get')
+    def test_get_profiles_chunks_requests(self, mock_client_get):
+        """Test URNs are split into batches of PROFILE_BATCH_SIZE."""
+        mock_client_get.return_value.content = b'{"results": {}}'
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        result = provider.get_profiles(
+            [f"urn:li:person:m{i}" for i in range(PROFILE_BATCH_SIZE + 1)]
+        )
+
+        assert result == {}
+        assert mock_client_get.call_count == 2
+        last_endpoint = mock_client_get.call_args_list[-1][0][0]
+        assert last_endpoint == f"people?ids=List((id:m{PROFILE_BATCH_SIZE}))"
+
+    def test_get_profiles_rejects_non_person_urn(self):
+        """Test non-person URNs are rejected before any request."""
+        provider = LinkedInProvider(access_token="test_token")
+
+        with pytest.raises(ValueError, match="Not a person URN"):
+            provider.get_profiles(["urn:li:organization:1"])
+
+    @patch('socialcli.providers.linkedin.client.LinkedInAPIClient.get')
+    def test_get_profiles_failure(self, mock_client_get):
+        """Test a failed batch request raises."""
+        mock_client_get.side_effect = requests.HTTPError("API error")
+        provider = LinkedInProvider(access_token="test_token")
+        provider._person_urn = "urn:li:person:test_user"
+
+        with pytest.raises(Exception, match="Failed to retrieve profiles"):
+            provider.get_profiles(["urn:li:person:abc"])
+
+    def test_get_profiles_empty(self):
+        """Test an empty list makes no requests."""
+        provider = LinkedInProvider(access_token="test_token")
+
+        assert provider.get_profiles([]) == {}
@@ -1,9 +1,11 @@
 """Tests for LinkedIn OAuth 2.0 authentication."""
 
+import base64
+import json
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
-from socialcli.providers.linkedin.auth import LinkedInAuth
+from socialcli.providers.linkedin.auth import LinkedInAuth, decode_jwt_claims
 from socialcli.core.config import Config, ProviderConfig
 
 
@@ -208,6 +210,92 @@ class TestTokenStorage:
         expected_expiry = before_save + timedelta(seconds=3600)
         assert abs((token_expiry - expected_expiry).total_seconds()) < 5
 
+    def test_save_tokens_resets_cached_person_urn(self, auth_handler):
+        """Test a new authorization drops the cached member URN unless refreshing."""
+        auth_handler.config.set_provider_config(
+            'linkedin', ProviderConfig(person_urn='urn:li:person:old')
+        )
+
+        auth_handler.save_tokens({'access_token': 'refreshed'}, keep_identity=True)
+        provider_config = auth_handler.config.get_provider_config('linkedin')
+        assert provider_config.person_urn == 'urn:li:person:old'
+
+        auth_handler.save_tokens({'access_token': 'new_login'})
+        assert provider_config.person_urn is None
+
+    def test_save_tokens_reads_member_from_id_token(self, auth_handler):
+        """Test the OpenID ID token's sub claim seeds the cached member URN."""
+        payload = base64.urlsafe_b64encode(
+            json.dumps({'sub': 'member123', 'iss': 'https://www.linkedin.com'}).encode()
+        ).decode().rstrip('=')
+
+        auth_handler.save_tokens({
+            'access_token': 'opaque',
+            'id_token': f'header.{payload}.signature'
+        })
+
+        provider_config = auth_handler.config.get_provider_config('linkedin')
+        assert provider_config.person_urn == 'urn:li:person:member123'
+
+        # An undecodable ID token leaves the URN for login() to resolve
+        auth_handler.save_tokens({'access_token': 'opaque', 'id_token': 'garbage'})
+        assert provider_config.person_urn is None
+
+    def test_save_tokens_uses_jwt_exp_claim(self, auth_handler):
+        """Test that a JWT access token's exp claim wins over expires_in."""
+        exp = int((datetime.now() + timedelta(days=2)).timestamp())
+        payload = base64.urlsafe_b64encode(
+            json.dumps({'sub': 'abc', 'exp': exp}).encode()
+        ).decode().rstrip('=')
+        token_data = {
+            'access_token': f'header.{payload}.signature',
+            'expires_in': 3600
+        }
+
+        auth_handler.save_tokens(token_data)
+
+        provider_config = auth_handler.config.get_provider_config('linkedin')
+        assert provider_config.token_expiry == datetime.fromtimestamp(exp).isoformat()
+
+    def test_save_tokens_out_of_range_exp_claim(self, auth_handler):
+        """Test that an exp claim datetime can't represent falls back to expires_in."""
+        payload = base64.urlsafe_b64encode(
+            json.dumps({'sub': 'abc', 'exp': 10 ** 20}).encode()
+        ).decode().rstrip('=')
+        token_data = {
+            'access_token': f'header.{payload}.signature',
+            'expires_in': 3600
+        }
+
+        before = datetime.now()
+        auth_handler.save_tokens(token_data)
+
+        provider_config = auth_handler.config.get_provider_config('linkedin')
+        expiry = datetime.fromisoformat(provider_config.token_expiry)
+        assert before + timedelta(seconds=3600) <= expiry <= datetime.now() + timedelta(seconds=3600)
+
+    def test_save_tokens_ignores_boolean_exp_claim(self, auth_handler):
+        """Test that a boolean exp claim is not read as a timestamp."""
+        payload = base64.urlsafe_b64encode(
+            json.dumps({'sub': 'abc', 'exp': True}).encode()
+        ).decode().rstrip('=')
+        token_data = {
+            'access_token': f'header.{payload}.signature',
+            'expires_in': 3600
+        }
+
+        before = datetime.now()
+        auth_handler.save_tokens(token_data)
+
+        provider_config = auth_handler.config.get_provider_config('linkedin')
+        expiry = datetime.fromisoformat(provider_config.token_expiry)
+        assert expiry >= before + timedelta(seconds=3600)
+
+    def test_decode_jwt_claims_opaque_token(self):
+        """Test that opaque tokens yield no claims."""
+        assert decode_jwt_claims('AQX-opaque-token') is None
+        assert decode_jwt_claims('a.!!!.c') is None
+
 
 class TestGetValidToken:
     """Test getting valid access token with automatic refresh."""
@@ -348,3 +436,11 @@ class TestOAuthScopes:
         assert "custom_scope" in url
         # Should not contain default scopes
         assert "w_member_social" not in url
+
+    def test_legacy_scopes(self, auth_handler):
+        """Test that legacy_scopes selects the pre-OpenID default scopes."""
+        url = auth_handler.get_authorization_url(legacy_scopes=True)
+
+        assert "w_member_social" in url
+        assert "r_liteprofile" in url
+        assert "openid" not in url
@@ -226,6 +226,19 @@ class TestConfig:
         assert 'linkedin' in config.providers
         assert config.providers['linkedin'].access_token == 'new_access_token'
 
+    def test_update_person_urn_round_trip(self, tmp_path):
+        """Test cached person URN is saved and loaded back."""
+        config_path = tmp_path / "config.yaml"
+        config = Config(
+            providers={'linkedin': ProviderConfig(client_id='id', client_secret='secret')},
+            config_path=config_path
+        )
+
+        config.update_person_urn('linkedin', 'urn:li:person:abc')
+
+        loaded = Config.load(config_path, validate=False)
+        assert loaded.providers['linkedin'].person_urn == 'urn:li:person:abc'
+
     def test_validate_valid_config(self, tmp_path):
         """Test validation succeeds for valid configuration."""
         config_path = tmp_path / "config.yaml"
@@ -0,0 +1,43 @@
+"""Tests for JSON encoding helpers."""
+
+import json
+import pytest
+
+from socialcli.utils import jsoncodec
+
+
+@pytest.fixture(params=[True, False], ids=['orjson', 'stdlib'])
+def codec(request, monkeypatch):
+    """Run each test against both the orjson and stdlib code paths."""
+    if request.param and not jsoncodec.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsoncodec, 'ORJSON_AVAILABLE', request.param)
+    return jsoncodec
+
+
+class TestJsonCodec:
+    """Test dumps/loads round trips."""
+
+    def test_dumps_returns_utf8_bytes(self, codec):
+        """Test compact output is UTF-8 bytes without ASCII escaping."""
+        encoded = codec.dumps({'text': 'Ciao è'})
+
+        assert isinstance(encoded, bytes)
+        assert 'è'.encode('utf-8') in encoded
+        assert json.loads(encoded) == {'text': 'Ciao è'}
+
+    def test_dumps_pretty_indents(self, codec):
+        """Test pretty output is indented by two spaces."""
+        encoded = codec.dumps({'a': [1, 2]}, pretty=True)
+
+        assert b'\n  "a"' in encoded
+
+    def test_loads_accepts_bytes_and_str(self, codec):
+        """Test loads decodes bytes and str input."""
+        assert codec.loads(b'{"id": 1}') == {'id': 1}
+        assert codec.loads('{"id": 1}') == {'id': 1}
+
+    def test_loads_invalid_raises_value_error(self, codec):
+        """Test invalid JSON raises ValueError on either backend."""
+        with pytest.raises(ValueError):
+            codec.loads(b'not json')
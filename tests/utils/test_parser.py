@@ -1,8 +1,10 @@
 """Tests for post file parser."""
 
+import os
 import pytest
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
 from socialcli.utils.parser import PostParser
 
 
@@ -165,6 +167,18 @@ Content."""
         with pytest.raises(ValueError, match="Invalid YAML"):
             PostParser(file_path)
 
+    def test_python_tags_rejected(self, temp_post_file):
+        """Test front matter is loaded with a safe loader."""
+        content = """---
+title: !!python/object/apply:os.getcwd []
+---
+
+Content"""
+        file_path = temp_post_file(content)
+
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            PostParser(file_path)
+
     def test_empty_front_matter(self, temp_post_file):
         """Test post with empty front matter section."""
         content = """---
@@ -363,6 +377,37 @@ Content with --- dashes --- in it."""
 
         assert parser.get_content() == "Content with --- dashes --- in it."
 
+    def test_leading_whitespace_is_not_front_matter(self, temp_post_file):
+        """Test front matter must start on the first line."""
+        content = """
+---
+title: Test
+---
+Body"""
+        file_path = temp_post_file(content)
+        parser = PostParser(file_path)
+
+        assert parser.get_title() is None
+        assert parser.get_content() == content.strip()
+
+    def test_unclosed_front_matter_is_content(self, temp_post_file):
+        """Test an opening fence without a closing one is plain content."""
+        content = "---\ntitle: Test\nBody"
+        file_path = temp_post_file(content)
+        parser = PostParser(file_path)
+
+        assert parser.metadata == {}
+        assert parser.get_content() == content
+
+    def test_crlf_line_endings(self, tmp_path):
+        """Test CRLF and CR line endings are normalized like text mode."""
+        file_path = tmp_path / "post.md"
+        file_path.write_bytes(b"---\r\ntitle: Test\r\n---\r\nLine one\r\nLine two\rLine three")
+        parser = PostParser(str(file_path))
+
+        assert parser.get_title() == "Test"
+        assert parser.get_content() == "Line one\nLine two\nLine three"
+
     def test_post_with_yaml_like_content(self, temp_post_file):
         """Test post with YAML-like content in body."""
         content = """---
@@ -406,3 +451,40 @@ Content with émojis 🎉 and spëcial çharacters."""
         assert parser.get_title() == "Test 测试"
         assert "🎉" in parser.get_content()
         assert "spëcial" in parser.get_content()
+
+
+class TestParseCache:
+    """Test caching of parsed files."""
+
+    def test_unchanged_file_not_reread(self, temp_post_file):
+        """Test parsing an unchanged file again skips reading it."""
+        file_path = temp_post_file("---\ntitle: Cached\n---\nBody")
+        PostParser(file_path)
+
+        with patch.object(Path, 'read_bytes', side_effect=AssertionError("re-read")):
+            parser = PostParser(file_path)
+
+        assert parser.get_title() == "Cached"
+        assert parser.get_content() == "Body"
+
+    def test_modified_file_reparsed(self, temp_post_file):
+        """Test an edited file is parsed again."""
+        file_path = temp_post_file("---\ntitle: Old\n---\nBody")
+        PostParser(file_path)
+
+        Path(file_path).write_text("---\ntitle: New\n---\nNew body", encoding='utf-8')
+        st = os.stat(file_path)
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        parser = PostParser(file_path)
+        assert parser.get_title() == "New"
+        assert parser.get_content() == "New body"
+
+    def test_metadata_not_shared_between_parsers(self, temp_post_file):
+        """Test mutating one parser's metadata does not leak into the cache."""
+        file_path = temp_post_file("---\ntags: [a, b]\n---\nBody")
+
+        first = PostParser(file_path)
+        first.metadata['tags'].append('c')
+
+        assert PostParser(file_path).get_tags() == ['a', 'b']